@@ -14,8 +14,10 @@ The central daemon that runs on the host and provides:
 
 from __future__ import annotations
 
-import json
+import asyncio
 import os
+import queue
+import selectors
 import signal
 import socket
 import subprocess
@@ -23,13 +25,27 @@ import shutil
 import sys
 import threading
 import time
-import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-from boxctl.host_config import get_config
+try:
+    from jeepney import DBusAddress, MessageType, new_method_call
+    from jeepney.io.blocking import open_dbus_connection
+
+    JEEPNEY_AVAILABLE = True
+except ImportError:
+    JEEPNEY_AVAILABLE = False
+
+from boxctl.container import ContainerManager
+from boxctl.host_config import get_config, get_tailscale_ip
+from boxctl.library import LibraryManager
 from boxctl.paths import ContainerDefaults
 from boxctl.ssh_tunnel import SSHTunnelServer, check_asyncssh_available
+from boxctl.utils.error_codes import ErrorCode
+from boxctl.utils.json_codec import JSONDecodeError, decode_json, encode_json
 from boxctl.utils.logging import get_daemon_logger, configure_logging
 from boxctl import container_naming
 
@@ -40,6 +56,51 @@ logger = get_daemon_logger("boxctld")
 # Buffer limits to prevent memory exhaustion (Finding #6)
 MAX_RECV_BUFFER_SIZE = 10 * 1024 * 1024  # 10MB max receive buffer
 MAX_MESSAGE_SIZE = 5 * 1024 * 1024  # 5MB max single message
+# Accept backlog for the control socket; bursts of CLI completion requests
+# should queue in the kernel rather than be refused
+SOCKET_BACKLOG = socket.SOMAXCONN
+# Threads waiting for connections on the control socket
+ACCEPTOR_THREADS = min(4, os.cpu_count() or 1)
+# Bytes per recv() when reading a control socket request
+RECV_CHUNK_SIZE = 65536
+# Worker threads reading and handling control socket requests
+REQUEST_WORKERS = 32
+# Cap on a stored pane frame; larger frames keep their tail (the bottom of the pane)
+MAX_SESSION_BUFFER_CHARS = 1024 * 1024
+# Idle time after a response before a kept-open client connection is closed;
+# the connection occupies a request worker meanwhile
+KEEPALIVE_IDLE_TIMEOUT = 30.0
+# Number of locks that container stream buffers are sharded across (power of 2)
+STREAM_SHARDS = 16
+# Max connections drained from the accept queue per readiness wakeup in
+# "greedy" accept mode; "single" mode takes one and polls again
+ACCEPT_BATCH = 64
+
+# rtnetlink multicast groups for interface address changes (linux/rtnetlink.h)
+_RTMGRP_IPV4_IFADDR = 0x10
+_RTMGRP_IPV6_IFADDR = 0x100
+# Address changes arrive as a burst of netlink messages; wait this long before probing
+IFADDR_SETTLE_SECONDS = 1.0
+
+# How long MCP/skill name lists are reused for completions (library scans the filesystem)
+LIBRARY_COMPLETION_TTL = 5.0
+
+# Sound played for critical notifications (via paplay)
+BELL_SOUND_PATH = "/usr/share/sounds/freedesktop/stereo/bell.oga"
+
+# freedesktop notification urgency levels (byte hint values)
+_DBUS_URGENCY = {"low": 0, "normal": 1, "critical": 2}
+
+# freedesktop notification server object (None without jeepney)
+_DBUS_NOTIFICATIONS = (
+    DBusAddress(
+        "/org/freedesktop/Notifications",
+        bus_name="org.freedesktop.Notifications",
+        interface="org.freedesktop.Notifications",
+    )
+    if JEEPNEY_AVAILABLE
+    else None
+)
 
 
 def _handle_sigpipe(signum, frame):
@@ -61,6 +122,65 @@ def _ssh_socket_path() -> Path:
     return get_config().socket_dir / "ssh.sock"
 
 
+def _open_ifaddr_watch() -> Optional[socket.socket]:
+    """Open a netlink socket that becomes readable when an interface address changes.
+
+    Returns None where rtnetlink is unavailable (non-Linux); callers then poll.
+    """
+    if not hasattr(socket, "AF_NETLINK"):
+        return None
+    try:
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+    except OSError:
+        return None
+    try:
+        sock.bind((0, _RTMGRP_IPV4_IFADDR | _RTMGRP_IPV6_IFADDR))
+        sock.setblocking(False)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _drain_socket(sock: socket.socket) -> None:
+    """Discard everything currently queued on a non-blocking socket."""
+    try:
+        while sock.recv(RECV_CHUNK_SIZE):
+            pass
+    except OSError:
+        # BlockingIOError when empty; ENOBUFS after an overflow just means "changed"
+        pass
+
+
+def _stream_subscriber(subscriber) -> Callable:
+    """Return the callable used to deliver frames to a stream subscriber.
+
+    Queues deliver via their bound put_nowait, which compares equal across
+    calls, so unsubscribing with the same queue finds the same entry.
+    """
+    if callable(subscriber):
+        return subscriber
+    return subscriber.put_nowait
+
+
+@dataclass(frozen=True, slots=True)
+class SessionSnapshot:
+    """Latest streamed frame for a session.
+
+    Immutable, so a frame is published with a single dict assignment and
+    readers never see a buffer from one frame with the cursor of another.
+    """
+
+    buffer: Optional[str] = None
+    cursor_x: int = 0
+    cursor_y: int = 0
+    pane_width: int = 0
+    pane_height: int = 0
+
+
+_EMPTY_SNAPSHOT = SessionSnapshot()
+
+
 def _check_docker_port_binding(port: int) -> Optional[str]:
     """Check if a port is bound by a Docker container.
 
@@ -98,12 +218,42 @@ class boxctld:
     def __init__(self, socket_path: Path) -> None:
         self.socket_path = socket_path
         self.config = get_config()
-        self.recent_notifications = {}  # Deduplication: (container, session) -> timestamp
-        self.notifications_lock = threading.Lock()  # Protects recent_notifications
         # Active notifications for auto-dismissal: (container, session) -> {desktop_id, telegram}
         self.active_notifications: Dict[Tuple[str, str], Dict[str, Any]] = {}
         self.active_notifications_lock = threading.Lock()
-        self.handlers = {
+        # Persistent session bus connection for desktop notifications (opened lazily)
+        self._notify_bus = None
+        self._notify_bus_lock = threading.Lock()
+        # One event loop thread waits on all helper subprocesses (notify-send,
+        # paplay, hooks, clipboard tools) instead of a blocked thread per child
+        self._aio_loop = asyncio.new_event_loop()
+        self._aio_thread = threading.Thread(
+            target=self._aio_loop.run_forever, daemon=True, name="subprocess-loop"
+        )
+        self._aio_thread.start()
+        # Control socket requests run on warm pooled threads, bounded under bursts
+        self._request_pool = ThreadPoolExecutor(
+            max_workers=REQUEST_WORKERS, thread_name_prefix="boxctld-req"
+        )
+        # Tool paths resolved once; they don't change while the daemon runs
+        self._wl_copy = shutil.which("wl-copy")
+        self._xclip = shutil.which("xclip")
+        self._xsel = shutil.which("xsel")
+        self._paplay = shutil.which("paplay")
+        self._notify_send = shutil.which("notify-send")
+        self._gdbus = shutil.which("gdbus")
+        # Clipboard: argv built once, writes coalesced by a writer thread
+        self._clipboard_cmds = self._build_clipboard_cmds()
+        # Notify hook and bell sound, stat'ed once (re-resolved on SIGHUP)
+        self._notify_hook_path: Optional[str] = None
+        self._beep_sound_path: Optional[str] = None
+        self._resolve_notify_paths()
+        self._clipboard_pending: Dict[str, str] = {}  # selection -> latest data
+        self._clipboard_lock = threading.Lock()
+        self._clipboard_flush_scheduled = False
+        # Action -> handler. Fixed after __init__; dispatch reads the dict
+        # directly, callers get a read-only view
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
             "notify": self._handle_notify,
             "clipboard": self._handle_clipboard,
             "add_host_port": self._handle_add_host_port,
@@ -114,22 +264,58 @@ class boxctld:
             "get_active_ports": self._handle_get_active_ports,
             "check_port": self._handle_check_port,
         }
-        # Streaming support: container -> {session -> {buffer, cursor_x, cursor_y}}
-        self.session_buffers: Dict[str, Dict[str, Dict]] = {}
-        self.stream_lock = threading.Lock()
-        # Stream subscribers: (container, session) -> list of callbacks
-        self.stream_subscribers: Dict[Tuple[str, str], list] = {}
+        self.handlers: Mapping[str, Callable] = MappingProxyType(self._handlers)
+        # Completion type -> handler (see _handle_get_completions)
+        self._completion_handlers = {
+            "projects": self._comp_projects,
+            "sessions": self._comp_sessions,
+            "worktrees": self._comp_worktrees,
+            "mcp": self._comp_mcp,
+            "skills": self._comp_skills,
+            "docker_containers": self._comp_docker_containers,
+        }
+        self._library = LibraryManager()
+        self._library_names: Dict[str, Tuple[float, List[str]]] = {}  # kind -> (time, names)
+        self._container_manager: Optional[ContainerManager] = None  # Created on first use
+        # Streaming support: container -> {session -> SessionSnapshot}. Readers
+        # and per-frame writers don't lock; adding or removing a container's
+        # entry takes one of STREAM_SHARDS locks, picked by _stream_lock(), so
+        # containers don't contend on a single lock.
+        self.session_buffers: Dict[str, Dict[str, SessionSnapshot]] = {}
+        self._stream_locks: Tuple[threading.Lock, ...] = tuple(
+            threading.Lock() for _ in range(STREAM_SHARDS)
+        )
+        # Stream subscribers: (container, session) -> tuple of callbacks. Tuples
+        # are replaced, never mutated, so the streaming path reads them unlocked;
+        # the lock only serializes subscribe/unsubscribe.
+        self.stream_subscribers: Dict[Tuple[str, str], Tuple[Callable, ...]] = {}
         self.subscribers_lock = threading.Lock()
+        # container_state and session_metadata are copy-on-write snapshots: writers
+        # build a new mapping under the lock and swap it in, readers just take the
+        # current reference without locking. Nested dicts are never mutated in place.
         # Container state (pushed from containers): container -> {worktrees: [...], ...}
-        self.container_state: Dict[str, Dict] = {}
-        self.container_state_lock = threading.Lock()
-        # Session metadata (pushed from containers): container -> {sessions: [...], updated_at: float}
-        self.session_metadata: Dict[str, Dict] = {}
-        self.session_metadata_lock = threading.Lock()
+        self.container_state: Mapping[str, Dict] = MappingProxyType({})
+        self.container_state_lock = threading.Lock()  # Writers only
+        # Session metadata (pushed from containers):
+        # container -> {sessions: [...], updated_at: float, completions: ["project/session", ...]}
+        self.session_metadata: Mapping[str, Dict] = MappingProxyType({})
+        self.session_metadata_lock = threading.Lock()  # Writers only
+        # Flattened completion lists as (generation, list). Writers bump the
+        # generation when the completion data changes; readers rebuild lazily.
+        self._worktrees_gen = 0
+        self._worktrees_flat: Tuple[int, List[str]] = (-1, [])
+        self._sessions_gen = 0
+        self._sessions_flat: Tuple[int, List[str]] = (-1, [])
         # Tailscale IP monitoring
         self.tailscale_monitor_thread: Optional[threading.Thread] = None
-        self.tailscale_monitor_running = False
+        # Set to stop the monitor; it also wakes the loop out of its wait
+        self._tailscale_stop_event = threading.Event()
         self._current_tailscale_ip: Optional[str] = None
+        # Netlink address-change watch and the socket pair used to wake the monitor
+        self._tailscale_ifaddr_watch: Optional[socket.socket] = None
+        self._tailscale_wakeup: Optional[Tuple[socket.socket, socket.socket]] = None
+        # Resolved bind addresses; reset when the Tailscale IP or config changes
+        self._bind_addresses_cache: Optional[Tuple[str, ...]] = None
         self._web_server_restart_event: Optional[threading.Event] = None
         # SSH tunnel server (AsyncSSH-based implementation)
         # Handles all container communication via SSH control channel and port forwarding
@@ -145,13 +331,55 @@ class boxctld:
         # Register control channel handlers
         self._register_ssh_handlers()
         logger.info("SSH tunnel server initialized")
-        # Cleanup timestamp tracking
-        self._last_cleanup_time = time.time()
         self.session_activity: Dict[Tuple[str, str], float] = {}
         # Rate limit state: agent -> {limited, resets_at, detected_at, error_type}
         self.rate_limit_state: Dict[str, Dict[str, Any]] = {}
         self.rate_limit_lock = threading.Lock()
 
+    def _submit_async(self, coro) -> Future:
+        """Schedule a coroutine on the subprocess loop without waiting for it."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._aio_loop)
+        future.add_done_callback(self._log_async_failure)
+        return future
+
+    @staticmethod
+    def _log_async_failure(future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Background task failed: {future.exception()}")
+
+    async def _arun(
+        self, args: List[str], timeout: float, input_data: Optional[bytes] = None
+    ) -> subprocess.CompletedProcess:
+        """Run a command on the event loop, killing it if it exceeds timeout.
+
+        args[0] should be an absolute path: together with close_fds=False this
+        lets CPython start the child with posix_spawn (vfork) instead of fork.
+        Our own fds are non-inheritable (PEP 446), so nothing leaks.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=subprocess.PIPE if input_data is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=False,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(input_data), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(args, timeout)
+        return subprocess.CompletedProcess(
+            args,
+            proc.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+
+    def _run_subprocess(self, args: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """Run a command on the event loop and block the calling thread on its result."""
+        return asyncio.run_coroutine_threadsafe(self._arun(args, timeout), self._aio_loop).result()
+
     def _handle_notify(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle notifications and dispatch to configured channels.
 
@@ -190,10 +418,10 @@ class boxctld:
         )
 
         if urgency == "critical":
-            self._beep()
+            self._submit_async(self._beep())
 
         # Run user hook if configured
-        self._run_notify_hook(title, summary_short, urgency)
+        self._submit_async(self._run_notify_hook(title, summary_short, urgency))
 
         return {"ok": all(results.values()), "channels": results}
 
@@ -241,11 +469,74 @@ class boxctld:
 
         return results
 
+    def _get_notify_bus(self):
+        """Return the shared session bus connection, opening it on first use."""
+        if self._notify_bus is None:
+            self._notify_bus = open_dbus_connection(bus="SESSION")
+        return self._notify_bus
+
+    def _close_notify_bus(self) -> None:
+        """Drop the session bus connection so the next call reconnects."""
+        if self._notify_bus is not None:
+            try:
+                self._notify_bus.close()
+            except Exception:
+                pass
+            self._notify_bus = None
+
+    def _dbus_notifications_call(self, method: str, signature: str, body: tuple) -> Optional[tuple]:
+        """Call org.freedesktop.Notifications over the persistent session bus.
+
+        Returns the reply body, or None if D-Bus is unavailable, the call failed,
+        or the bus answered with an error (e.g. no notification server running).
+        """
+        if not JEEPNEY_AVAILABLE:
+            return None
+        with self._notify_bus_lock:
+            try:
+                bus = self._get_notify_bus()
+                reply = bus.send_and_get_reply(
+                    new_method_call(_DBUS_NOTIFICATIONS, method, signature, body), timeout=10
+                )
+            except Exception as e:
+                logger.debug(f"D-Bus {method} failed: {e}")
+                self._close_notify_bus()
+                return None
+        # Error replies come back as ordinary messages; the body is the error text
+        if reply.header.message_type == MessageType.error:
+            logger.debug(f"D-Bus {method} returned an error: {reply.body}")
+            return None
+        return reply.body
+
     def _send_desktop_notification(self, title: str, message: str, urgency: str) -> Optional[int]:
-        """Send notification via notify-send, return notification ID."""
-        args = ["notify-send", "-p", "-u", urgency, title, message]  # -p prints ID
+        """Send desktop notification, return notification ID.
+
+        Talks to the notification server over D-Bus when jeepney is available,
+        falling back to notify-send.
+        """
+        reply = self._dbus_notifications_call(
+            "Notify",
+            "susssasa{sv}i",
+            (
+                "boxctl",
+                0,
+                "",
+                title,
+                message,
+                [],
+                {"urgency": ("y", _DBUS_URGENCY.get(urgency, 1))},
+                -1,
+            ),
+        )
+        if reply:
+            return int(reply[0])
+
+        if not self._notify_send:
+            logger.warning("notify-send not found - cannot show desktop notification")
+            return None
+        args = [self._notify_send, "-p", "-u", urgency, title, message]  # -p prints ID
         try:
-            result = subprocess.run(args, check=False, capture_output=True, text=True, timeout=10)
+            result = self._run_subprocess(args, timeout=10)
             if result.returncode != 0:
                 logger.warning(result.stderr.strip() or "notify-send failed")
                 return None
@@ -310,10 +601,40 @@ class boxctld:
             logger.warning(f"Telegram notification failed: {e}")
             return False, None
 
+    def _build_clipboard_cmds(self) -> Optional[Dict[str, List[str]]]:
+        """Pre-assemble clipboard argv per selection: wl-copy (Wayland), then xclip/xsel (X11).
+
+        Returns None if no clipboard tool is installed.
+        """
+        if self._wl_copy:
+            return {"primary": [self._wl_copy, "--primary"], "clipboard": [self._wl_copy]}
+        if self._xclip:
+            return {
+                "primary": [self._xclip, "-selection", "primary"],
+                "clipboard": [self._xclip, "-selection", "clipboard"],
+            }
+        if self._xsel:
+            return {
+                "primary": [self._xsel, "--primary", "--input"],
+                "clipboard": [self._xsel, "--clipboard", "--input"],
+            }
+        return None
+
+    def _clipboard_cmd(self, selection: str) -> List[str]:
+        """Return the argv for a selection (xclip also accepts e.g. "secondary")."""
+        cmd = self._clipboard_cmds.get(selection)
+        if cmd is None:
+            if self._xclip and not self._wl_copy:
+                return [self._xclip, "-selection", selection]
+            return self._clipboard_cmds["clipboard"]
+        return cmd
+
     def _handle_clipboard(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle clipboard set requests from containers.
 
         Uses wl-copy for Wayland or xclip for X11 to set the host clipboard.
+        Writes are queued to the subprocess loop; bursts to the same
+        selection collapse to the latest payload.
         """
         data = payload.get("data", "")
         selection = payload.get("selection", "primary")  # primary or clipboard
@@ -321,47 +642,91 @@ class boxctld:
         if not data:
             return {"ok": False, "error": "empty_data"}
 
-        # Try wl-copy first (Wayland), fall back to xclip (X11)
-        if shutil.which("wl-copy"):
-            if selection == "primary":
-                cmd = ["wl-copy", "--primary"]
-            else:
-                cmd = ["wl-copy"]
-        elif shutil.which("xclip"):
-            cmd = ["xclip", "-selection", selection]
-        elif shutil.which("xsel"):
-            if selection == "primary":
-                cmd = ["xsel", "--primary", "--input"]
-            else:
-                cmd = ["xsel", "--clipboard", "--input"]
-        else:
+        if self._clipboard_cmds is None:
             logger.warning("No clipboard tool found (wl-copy, xclip, xsel)")
             return {"ok": False, "error": "no_clipboard_tool"}
 
+        with self._clipboard_lock:
+            self._clipboard_pending[selection] = data
+            if not self._clipboard_flush_scheduled:
+                self._clipboard_flush_scheduled = True
+                self._submit_async(self._flush_clipboard())
+
+        return {"ok": True}
+
+    async def _flush_clipboard(self) -> None:
+        """Apply queued clipboard writes until the queue is drained."""
+        while True:
+            with self._clipboard_lock:
+                pending = self._clipboard_pending
+                self._clipboard_pending = {}
+                if not pending:
+                    self._clipboard_flush_scheduled = False
+                    return
+
+            for selection, data in pending.items():
+                await self._write_clipboard(self._clipboard_cmd(selection), data)
+
+    async def _write_clipboard(self, cmd: List[str], data: str) -> None:
+        """Pipe data into a clipboard tool."""
         try:
-            # Use Popen to avoid blocking on wl-copy which daemonizes to serve clipboard
-            proc = subprocess.Popen(
-                cmd,
+            # Don't wait for exit: wl-copy daemonizes to serve the clipboard
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                text=True,
+                close_fds=False,  # posix_spawn fast path, see _arun
             )
             # Write data and close stdin - wl-copy reads this then forks to background
-            proc.stdin.write(data)
+            proc.stdin.write(data.encode("utf-8"))
+            await proc.stdin.drain()
             proc.stdin.close()
 
             # Give wl-copy a moment to process and fork (typically <100ms)
             try:
-                proc.wait(timeout=0.5)
-            except subprocess.TimeoutExpired:
+                await asyncio.wait_for(proc.wait(), timeout=0.5)
+            except asyncio.TimeoutError:
                 # wl-copy daemonized successfully (still running = good)
                 pass
-
-            return {"ok": True}
         except OSError as e:
             logger.error(f"Clipboard exception: {e}")
-            return {"ok": False, "error": str(e)}
+
+    def _port_rpc(
+        self,
+        container: str,
+        action: str,
+        fields: Dict[str, Any],
+        success_message: str,
+        timeout: float = 10.0,
+    ) -> Dict[str, Any]:
+        """Send a port request to a connected container and translate the response.
+
+        The connection is looked up in a single critical section and the request
+        goes out over that connection, so a disconnect between the check and the
+        RPC can't redirect it.
+        """
+        with self.ssh_tunnel_server.connections_lock:
+            conn = self.ssh_tunnel_server.connections.get(container)
+        if conn is None:
+            return {
+                "ok": False,
+                "error": f"container {container} not connected",
+                "code": ErrorCode.NOT_CONNECTED,
+            }
+
+        response = self.ssh_tunnel_server.request_to_connection_sync(
+            conn, action, fields, timeout=timeout
+        )
+        if response is None:
+            return {"ok": False, "error": "failed to communicate with container"}
+        if response.get("ok"):
+            return {"ok": True, "message": success_message}
+        error = response.get("error", "unknown error")
+        # Containers report bind failures as exception text; classify it once here
+        if "in use" in error.lower():
+            return {"ok": False, "error": error, "code": ErrorCode.PORT_IN_USE}
+        return {"ok": False, "error": error}
 
     def _handle_add_host_port(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle request to add a host port listener (expose container to host)."""
@@ -378,14 +743,11 @@ class boxctld:
             return {
                 "ok": False,
                 "error": f"Port {host_port} is already bound by Docker container '{docker_container}'",
+                "code": ErrorCode.DOCKER_CONFLICT,
             }
 
         # Send request to container to set up remote forward via SSH
-        with self.ssh_tunnel_server.connections_lock:
-            if container not in self.ssh_tunnel_server.connections:
-                return {"ok": False, "error": f"container {container} not connected"}
-
-        response = self.ssh_tunnel_server.request_to_container_sync(
+        return self._port_rpc(
             container,
             "port_add",
             {
@@ -394,15 +756,8 @@ class boxctld:
                 "container_port": container_port,
                 "name": f"dynamic-{host_port}",
             },
-            timeout=10.0,
+            f"Port {host_port} exposed via SSH tunnel",
         )
-        if response is None:
-            return {"ok": False, "error": "failed to communicate with container"}
-        if response.get("ok"):
-            return {"ok": True, "message": f"Port {host_port} exposed via SSH tunnel"}
-        else:
-            error = response.get("error", "unknown error")
-            return {"ok": False, "error": error}
 
     def _handle_add_container_port(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle request to forward a host port into the container.
@@ -417,13 +772,8 @@ class boxctld:
         if not container or not host_port:
             return {"ok": False, "error": "missing required fields: container, host_port"}
 
-        # Check if container is connected
-        with self.ssh_tunnel_server.connections_lock:
-            if container not in self.ssh_tunnel_server.connections:
-                return {"ok": False, "error": f"container {container} not connected"}
-
         # Send request to container to set up local forward via SSH
-        response = self.ssh_tunnel_server.request_to_container_sync(
+        return self._port_rpc(
             container,
             "port_add",
             {
@@ -432,15 +782,8 @@ class boxctld:
                 "container_port": container_port,
                 "name": f"dynamic-{host_port}",
             },
-            timeout=10.0,
+            f"Host port {host_port} forwarded into container",
         )
-        if response is None:
-            return {"ok": False, "error": "failed to communicate with container"}
-        if response.get("ok"):
-            return {"ok": True, "message": f"Host port {host_port} forwarded into container"}
-        else:
-            error = response.get("error", "unknown error")
-            return {"ok": False, "error": error}
 
     def _handle_remove_host_port(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle request to remove a host port listener (unexpose).
@@ -453,28 +796,13 @@ class boxctld:
         if not container or not host_port:
             return {"ok": False, "error": "missing required fields: container, host_port"}
 
-        # Check if container is connected
-        with self.ssh_tunnel_server.connections_lock:
-            if container not in self.ssh_tunnel_server.connections:
-                return {"ok": False, "error": f"container {container} not connected"}
-
         # Send request to container to remove remote forward
-        response = self.ssh_tunnel_server.request_to_container_sync(
+        return self._port_rpc(
             container,
             "port_remove",
-            {
-                "direction": "remote",
-                "host_port": host_port,
-            },
-            timeout=10.0,
+            {"direction": "remote", "host_port": host_port},
+            f"Port {host_port} unexposed",
         )
-        if response is None:
-            return {"ok": False, "error": "failed to communicate with container"}
-        if response.get("ok"):
-            return {"ok": True, "message": f"Port {host_port} unexposed"}
-        else:
-            error = response.get("error", "unknown error")
-            return {"ok": False, "error": error}
 
     def _handle_remove_container_port(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle request to remove a forwarded host port from container.
@@ -487,28 +815,13 @@ class boxctld:
         if not container or not host_port:
             return {"ok": False, "error": "missing required fields: container, host_port"}
 
-        # Check if container is connected
-        with self.ssh_tunnel_server.connections_lock:
-            if container not in self.ssh_tunnel_server.connections:
-                return {"ok": False, "error": f"container {container} not connected"}
-
         # Send request to container to remove local forward
-        response = self.ssh_tunnel_server.request_to_container_sync(
+        return self._port_rpc(
             container,
             "port_remove",
-            {
-                "direction": "local",
-                "host_port": host_port,
-            },
-            timeout=10.0,
+            {"direction": "local", "host_port": host_port},
+            f"Port {host_port} unforwarded",
         )
-        if response is None:
-            return {"ok": False, "error": "failed to communicate with container"}
-        if response.get("ok"):
-            return {"ok": True, "message": f"Port {host_port} unforwarded"}
-        else:
-            error = response.get("error", "unknown error")
-            return {"ok": False, "error": error}
 
     def _handle_get_completions(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle completion data requests for CLI tab-completion.
@@ -523,101 +836,110 @@ class boxctld:
         - docker_containers: Non-boxctl docker containers
         """
         comp_type = payload.get("type")
+        handler = self._completion_handlers.get(comp_type)
+        if handler is None:
+            return {"ok": False, "error": f"unknown completion type: {comp_type}"}
+        return handler(payload)
 
-        if comp_type == "projects":
-            # Return project names from connected containers (via SSH tunnel)
-            with self.ssh_tunnel_server.connections_lock:
-                projects = []
-                for name in self.ssh_tunnel_server.connections.keys():
-                    # Extract project name using container_naming (handles hashed names)
-                    project_name = container_naming.extract_project_name(name)
-                    if project_name:
-                        projects.append(project_name)
-            return {"ok": True, "projects": projects}
-
-        elif comp_type == "sessions":
-            # Return sessions from session_metadata (pushed by containers)
-            # Falls back to session_buffers if metadata not available
-            project = payload.get("project")
-            with self.session_metadata_lock:
-                if project:
-                    # Sanitize project name to match Docker container naming
-                    sanitized = container_naming.sanitize_name(project)
-                    container = f"{container_naming.CONTAINER_PREFIX}{sanitized}"
-                    meta = self.session_metadata.get(container, {})
-                    sessions = [s["name"] for s in meta.get("sessions", [])]
-                else:
-                    # Return all sessions as "project/session" (only boxctl containers)
-                    sessions = []
-                    for container, meta in self.session_metadata.items():
-                        proj = container_naming.extract_project_name(container)
-                        if not proj:
-                            continue  # Skip non-boxctl containers
-                        for sess in meta.get("sessions", []):
-                            sessions.append(f"{proj}/{sess['name']}")
-            return {"ok": True, "sessions": sessions}
-
-        elif comp_type == "worktrees":
-            # Return cached worktrees from container state
-            project = payload.get("project")
-            with self.container_state_lock:
-                if project:
-                    # Sanitize project name to match Docker container naming
-                    sanitized = container_naming.sanitize_name(project)
-                    container = f"{container_naming.CONTAINER_PREFIX}{sanitized}"
-                    state = self.container_state.get(container, {})
-                    worktrees = state.get("worktrees", [])
-                else:
-                    # Return all worktrees (only from boxctl containers)
-                    worktrees = []
-                    for container, state in self.container_state.items():
-                        proj = container_naming.extract_project_name(container)
-                        if not proj:
-                            continue  # Skip non-boxctl containers
-                        worktrees.extend(state.get("worktrees", []))
-            return {"ok": True, "worktrees": worktrees}
-
-        elif comp_type == "mcp":
-            # Query MCP servers on demand (fast: ~1ms)
-            try:
-                from boxctl.library import LibraryManager
-
-                lib = LibraryManager()
-                servers = lib.list_mcp_servers()
-                names = [s["name"] for s in servers]
-                return {"ok": True, "mcp_servers": names}
-            except Exception as e:
-                logger.debug(f"Error listing MCP servers: {e}")
-                return {"ok": True, "mcp_servers": []}
-
-        elif comp_type == "skills":
-            # Query skills on demand (fast: ~23ms)
-            try:
-                from boxctl.library import LibraryManager
-
-                lib = LibraryManager()
-                skills = lib.list_skills()
-                names = [s["name"] for s in skills]
-                return {"ok": True, "skills": names}
-            except Exception as e:
-                logger.debug(f"Error listing skills: {e}")
-                return {"ok": True, "skills": []}
-
-        elif comp_type == "docker_containers":
-            # Query non-boxctl docker containers
-            include_boxctl = payload.get("include_boxctl", False)
-            try:
-                from boxctl.container import ContainerManager
+    def _comp_projects(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Return project names from connected containers (via SSH tunnel)."""
+        with self.ssh_tunnel_server.connections_lock:
+            names = list(self.ssh_tunnel_server.connections)
+        # Extract project name using container_naming (handles hashed names)
+        projects = [
+            project_name
+            for name in names
+            if (project_name := container_naming.extract_project_name(name))
+        ]
+        return {"ok": True, "projects": projects}
+
+    def _comp_sessions(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Return sessions from session_metadata (pushed by containers)."""
+        project = payload.get("project")
+        if project:
+            # Sanitize project name to match Docker container naming
+            sanitized = container_naming.sanitize_name(project)
+            container = f"{container_naming.CONTAINER_PREFIX}{sanitized}"
+            meta = self.session_metadata.get(container, {})
+            sessions = [s["name"] for s in meta.get("sessions", [])]
+        else:
+            # Return all sessions as "project/session" (only boxctl containers)
+            gen = self._sessions_gen
+            snapshot = self.session_metadata
+            cached_gen, flat = self._sessions_flat
+            if cached_gen != gen:
+                flat = [s for meta in snapshot.values() for s in meta.get("completions", ())]
+                self._sessions_flat = (gen, flat)
+            sessions = flat[:]
+        return {"ok": True, "sessions": sessions}
+
+    def _comp_worktrees(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Return cached worktrees from container state."""
+        project = payload.get("project")
+        if project:
+            # Sanitize project name to match Docker container naming
+            sanitized = container_naming.sanitize_name(project)
+            container = f"{container_naming.CONTAINER_PREFIX}{sanitized}"
+            state = self.container_state.get(container, {})
+            worktrees = state.get("worktrees", [])
+        else:
+            # Return all worktrees (only from boxctl containers)
+            gen = self._worktrees_gen
+            snapshot = self.container_state
+            cached_gen, flat = self._worktrees_flat
+            if cached_gen != gen:
+                prefix = container_naming.CONTAINER_PREFIX
+                flat = [
+                    w
+                    for container, state in snapshot.items()
+                    if container.startswith(prefix) and len(container) > len(prefix)
+                    for w in state.get("worktrees", ())
+                ]
+                self._worktrees_flat = (gen, flat)
+            worktrees = flat[:]
+        return {"ok": True, "worktrees": worktrees}
+
+    def _library_completion_names(self, kind: str, list_items) -> List[str]:
+        """Return library item names, reusing a recent scan for LIBRARY_COMPLETION_TTL."""
+        now = time.monotonic()
+        cached = self._library_names.get(kind)
+        if cached and now - cached[0] < LIBRARY_COMPLETION_TTL:
+            return cached[1][:]
+        names = [item["name"] for item in list_items()]
+        self._library_names[kind] = (now, names)
+        return names[:]
+
+    def _comp_mcp(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Query MCP servers on demand (fast: ~1ms)."""
+        try:
+            names = self._library_completion_names("mcp", self._library.list_mcp_servers)
+            return {"ok": True, "mcp_servers": names}
+        except Exception as e:
+            logger.debug(f"Error listing MCP servers: {e}")
+            return {"ok": True, "mcp_servers": []}
 
-                manager = ContainerManager()
-                containers = manager.get_all_containers(include_boxctl=include_boxctl)
-                names = [c["name"] for c in containers]
-                return {"ok": True, "docker_containers": names}
-            except Exception as e:
-                logger.debug(f"Error listing docker containers: {e}")
-                return {"ok": True, "docker_containers": []}
+    def _comp_skills(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Query skills on demand (fast: ~23ms)."""
+        try:
+            names = self._library_completion_names("skills", self._library.list_skills)
+            return {"ok": True, "skills": names}
+        except Exception as e:
+            logger.debug(f"Error listing skills: {e}")
+            return {"ok": True, "skills": []}
 
-        return {"ok": False, "error": f"unknown completion type: {comp_type}"}
+    def _comp_docker_containers(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Query non-boxctl docker containers."""
+        include_boxctl = payload.get("include_boxctl", False)
+        try:
+            # Kept once created; creation fails (and is retried) while Docker is down
+            if self._container_manager is None:
+                self._container_manager = ContainerManager()
+            containers = self._container_manager.get_all_containers(include_boxctl=include_boxctl)
+            names = [c["name"] for c in containers]
+            return {"ok": True, "docker_containers": names}
+        except Exception as e:
+            logger.debug(f"Error listing docker containers: {e}")
+            return {"ok": True, "docker_containers": []}
 
     def _handle_get_active_ports(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Get all active ports across all connected containers.
@@ -628,34 +950,40 @@ class boxctld:
         host_ports = []  # Exposed ports (container -> host)
         container_ports = []  # Forwarded ports (host -> container)
 
+        # Only copy the forward lists under the lock; build results after releasing it
         with self.ssh_tunnel_server.connections_lock:
-            for container, conn in self.ssh_tunnel_server.connections.items():
-                # Remote forwards = exposed ports (container listening -> host)
-                # Stored as: {"host_port": ..., "listen_host": ...}
-                # The host_port is the port on host, container_port is same (or from config)
-                for fwd in conn.remote_forwards:
-                    hp = fwd.get("host_port", 0)
-                    host_ports.append(
-                        {
-                            "host_port": hp,
-                            "container_port": fwd.get("container_port", hp),
-                            "container": container,
-                        }
-                    )
-                # Local forwards = forwarded ports (host -> container listening)
-                # Stored as: {"host": dest_host, "port": dest_port} OR
-                # {"host_port": ..., "container_port": ...} depending on source
-                for fwd in conn.local_forwards:
-                    # Handle both storage formats
-                    hp = fwd.get("host_port") or fwd.get("port", 0)
-                    cp = fwd.get("container_port") or fwd.get("port", hp)
-                    container_ports.append(
-                        {
-                            "host_port": hp,
-                            "container_port": cp,
-                            "container": container,
-                        }
-                    )
+            snapshot = [
+                (container, tuple(conn.remote_forwards), tuple(conn.local_forwards))
+                for container, conn in self.ssh_tunnel_server.connections.items()
+            ]
+
+        for container, remote_forwards, local_forwards in snapshot:
+            # Remote forwards = exposed ports (container listening -> host)
+            # Stored as: {"host_port": ..., "listen_host": ...}
+            # The host_port is the port on host, container_port is same (or from config)
+            for fwd in remote_forwards:
+                hp = fwd.get("host_port", 0)
+                host_ports.append(
+                    {
+                        "host_port": hp,
+                        "container_port": fwd.get("container_port", hp),
+                        "container": container,
+                    }
+                )
+            # Local forwards = forwarded ports (host -> container listening)
+            # Stored as: {"host": dest_host, "port": dest_port} OR
+            # {"host_port": ..., "container_port": ...} depending on source
+            for fwd in local_forwards:
+                # Handle both storage formats
+                hp = fwd.get("host_port") or fwd.get("port", 0)
+                cp = fwd.get("container_port") or fwd.get("port", hp)
+                container_ports.append(
+                    {
+                        "host_port": hp,
+                        "container_port": cp,
+                        "container": container,
+                    }
+                )
 
         return {
             "ok": True,
@@ -765,31 +1093,29 @@ class boxctld:
             "used_by": None,
         }
 
-    def _run_notify_hook(self, title: str, message: str, urgency: str) -> None:
-        """Run user notify hook script if configured."""
+    def _resolve_notify_paths(self) -> None:
+        """Resolve the notify hook and bell sound paths, or None if not usable."""
         hook_path = self.config.get("notify_hook")
-        if not hook_path:
-            return
+        hook_path = os.path.expanduser(hook_path) if hook_path else None
+        self._notify_hook_path = hook_path if hook_path and os.path.isfile(hook_path) else None
+        self._beep_sound_path = (
+            BELL_SOUND_PATH if self._paplay and os.path.exists(BELL_SOUND_PATH) else None
+        )
 
-        hook = Path(hook_path).expanduser()
-        if not hook.exists() or not hook.is_file():
+    async def _run_notify_hook(self, title: str, message: str, urgency: str) -> None:
+        """Run user notify hook script if configured."""
+        if not self._notify_hook_path:
             return
 
         try:
-            subprocess.run(
-                [str(hook), title, message, urgency],
-                check=False,
-                capture_output=True,
-                timeout=5,
-            )
+            await self._arun([self._notify_hook_path, title, message, urgency], timeout=5)
         except (OSError, subprocess.SubprocessError) as e:
             logger.warning(f"Notify hook failed: {e}")
 
-    def _beep(self) -> None:
-        sound = Path("/usr/share/sounds/freedesktop/stereo/bell.oga")
-        if sound.exists() and shutil.which("paplay"):
+    async def _beep(self) -> None:
+        if self._beep_sound_path:
             try:
-                subprocess.run(["paplay", str(sound)], check=False, timeout=5)
+                await self._arun([self._paplay, self._beep_sound_path], timeout=5)
             except subprocess.TimeoutExpired:
                 pass
             return
@@ -800,12 +1126,17 @@ class boxctld:
         except Exception:
             pass
 
-    def _get_bind_addresses(self) -> list:
-        """Get list of addresses to bind port listeners to.
+    def _get_bind_addresses(self) -> Tuple[str, ...]:
+        """Get addresses to bind port listeners to.
 
         Reads from config network.bind_addresses, resolving "tailscale"
-        to the current Tailscale IP from the monitor.
+        to the current Tailscale IP from the monitor. The result is cached
+        until the Tailscale IP changes or the config is reloaded.
         """
+        cached = self._bind_addresses_cache
+        if cached is not None:
+            return cached
+
         cfg = self.config.get("network", default={})
         configured = cfg.get("bind_addresses", ["127.0.0.1", "tailscale"])
 
@@ -817,7 +1148,8 @@ class boxctld:
             else:
                 resolved.append(addr)
 
-        return resolved if resolved else ["127.0.0.1"]
+        self._bind_addresses_cache = tuple(resolved) if resolved else ("127.0.0.1",)
+        return self._bind_addresses_cache
 
     def _register_ssh_handlers(self) -> None:
         """Register all handlers for the SSH control channel."""
@@ -1079,61 +1411,79 @@ class boxctld:
         """Handle stream_register event from SSH control channel."""
         session = payload.get("session", "unknown")
         logger.debug(f"SSH stream register: {container}/{session}")
-        with self.stream_lock:
-            if container not in self.session_buffers:
-                self.session_buffers[container] = {}
+        with self._stream_lock(container):
+            sessions = self.session_buffers.setdefault(container, {})
+            if session not in sessions:
+                sessions[session] = _EMPTY_SNAPSHOT
 
     def _ssh_handle_stream_data(self, container: str, payload: dict) -> None:
-        """Handle stream_data event from SSH control channel."""
-        session = payload.get("session", "unknown")
-        data = payload.get("data", "")
-        cursor_x = payload.get("cursor_x", 0)
-        cursor_y = payload.get("cursor_y", 0)
-        pane_width = payload.get("pane_width", 80)
-        pane_height = payload.get("pane_height", 24)
-
-        stream_data = {
-            "buffer": data,
-            "cursor_x": cursor_x,
-            "cursor_y": cursor_y,
-            "pane_width": pane_width,
-            "pane_height": pane_height,
-        }
+        """Handle stream_data event from SSH control channel.
 
-        with self.stream_lock:
-            if container not in self.session_buffers:
-                self.session_buffers[container] = {}
-            self.session_buffers[container][session] = stream_data
+        Each frame is published as a new SessionSnapshot with one dict
+        assignment; only creating the container's entry takes a lock. Frames
+        are whole visible-pane captures that replace the previous one, so each
+        session holds at most one buffer of up to MAX_SESSION_BUFFER_CHARS.
+        """
+        session = payload.get("session", "unknown")
+        buffer = payload.get("data", "")
+        if len(buffer) > MAX_SESSION_BUFFER_CHARS:
+            buffer = buffer[-MAX_SESSION_BUFFER_CHARS:]
+
+        sessions = self.session_buffers.get(container)
+        if sessions is None:
+            with self._stream_lock(container):
+                sessions = self.session_buffers.setdefault(container, {})
+
+        snapshot = SessionSnapshot(
+            buffer,
+            payload.get("cursor_x", 0),
+            payload.get("cursor_y", 0),
+            payload.get("pane_width", 80),
+            payload.get("pane_height", 24),
+        )
+        sessions[session] = snapshot
 
         # Notify subscribers
-        self._notify_stream_subscribers(container, session, stream_data)
+        self._notify_stream_subscribers(container, session, snapshot)
 
     def _ssh_handle_stream_unregister(self, container: str, payload: dict) -> None:
         """Handle stream_unregister event from SSH control channel."""
         session = payload.get("session", "unknown")
         logger.debug(f"SSH stream unregister: {container}/{session}")
-        with self.stream_lock:
+        with self._stream_lock(container):
             if container in self.session_buffers:
                 self.session_buffers[container].pop(session, None)
-            key = (container, session)
-            self.session_activity.pop(key, None)
+        self.session_activity.pop((container, session), None)
 
     def _ssh_handle_state_update(self, container: str, payload: dict) -> None:
         """Handle state_update event from SSH control channel."""
-        with self.container_state_lock:
-            if container not in self.container_state:
-                self.container_state[container] = {}
-            if "worktrees" in payload:
-                self.container_state[container]["worktrees"] = payload["worktrees"]
-                logger.debug(f"SSH state update: {container} worktrees={payload['worktrees']}")
+        if "worktrees" in payload:
+            worktrees = payload["worktrees"]
+            with self.container_state_lock:
+                old_state = self.container_state.get(container, {})
+                new_states = dict(self.container_state)
+                new_states[container] = {**old_state, "worktrees": worktrees}
+                # Publish the snapshot before bumping the generation
+                self.container_state = MappingProxyType(new_states)
+                if old_state.get("worktrees") != worktrees:
+                    self._worktrees_gen += 1
+            logger.debug(f"SSH state update: {container} worktrees={worktrees}")
 
         # Store session metadata separately with timestamp
         if "sessions" in payload:
+            proj = container_naming.extract_project_name(container)
+            completions = [f"{proj}/{sess['name']}" for sess in payload["sessions"]] if proj else []
             with self.session_metadata_lock:
-                self.session_metadata[container] = {
+                old_meta = self.session_metadata.get(container, {})
+                new_metadata = dict(self.session_metadata)
+                new_metadata[container] = {
                     "sessions": payload["sessions"],
                     "updated_at": time.time(),
+                    "completions": completions,
                 }
+                self.session_metadata = MappingProxyType(new_metadata)
+                if old_meta.get("completions", []) != completions:
+                    self._sessions_gen += 1
                 logger.debug(f"SSH state update: {container} sessions={len(payload['sessions'])}")
 
     def _ssh_handle_forward_removed(self, container: str, payload: dict) -> None:
@@ -1144,6 +1494,12 @@ class boxctld:
         if not direction or not host_port:
             return
 
+        if direction == "remote":
+            # The tunnel server keeps its host port index in step with the list
+            if self.ssh_tunnel_server.untrack_remote_forward(container, host_port):
+                logger.debug(f"Removed remote forward tracking: {container}:{host_port}")
+            return
+
         with self.ssh_tunnel_server.connections_lock:
             conn = self.ssh_tunnel_server.connections.get(container)
             if not conn:
@@ -1154,11 +1510,6 @@ class boxctld:
                     f for f in conn.local_forwards if f.get("host_port") != host_port
                 ]
                 logger.debug(f"Removed local forward tracking: {container}:{host_port}")
-            elif direction == "remote":
-                conn.remote_forwards = [
-                    f for f in conn.remote_forwards if f.get("host_port") != host_port
-                ]
-                logger.debug(f"Removed remote forward tracking: {container}:{host_port}")
 
     def _ssh_handle_local_forwards_registered(self, container: str, payload: dict) -> None:
         """Handle local_forwards_registered event - track local forwards for display.
@@ -1199,7 +1550,7 @@ class boxctld:
 
         logger.debug(f"Dismissing notifications for {container}/{session}")
 
-        # Dismiss desktop notification via gdbus
+        # Dismiss desktop notification
         desktop_id = notification_data.get("desktop_id")
         if desktop_id:
             self._dismiss_desktop_notification(desktop_id)
@@ -1212,11 +1563,20 @@ class boxctld:
             )
 
     def _dismiss_desktop_notification(self, notification_id: int) -> bool:
-        """Dismiss a desktop notification via gdbus."""
+        """Dismiss a desktop notification via D-Bus (gdbus fallback)."""
+        if (
+            self._dbus_notifications_call("CloseNotification", "u", (int(notification_id),))
+            is not None
+        ):
+            logger.debug(f"Dismissed desktop notification {notification_id}")
+            return True
+        if not self._gdbus:
+            logger.debug("gdbus not found - cannot dismiss desktop notification")
+            return False
         try:
-            result = subprocess.run(
+            result = self._run_subprocess(
                 [
-                    "gdbus",
+                    self._gdbus,
                     "call",
                     "--session",
                     "--dest",
@@ -1227,8 +1587,6 @@ class boxctld:
                     "org.freedesktop.Notifications.CloseNotification",
                     str(notification_id),
                 ],
-                check=False,
-                capture_output=True,
                 timeout=5,
             )
             if result.returncode == 0:
@@ -1287,11 +1645,8 @@ class boxctld:
         logger.info(f"SSH tunnel: container {container} disconnected")
 
         # Clean up session buffers for this container
-        sessions_to_cleanup = []
-        with self.stream_lock:
-            if container in self.session_buffers:
-                sessions_to_cleanup = list(self.session_buffers[container].keys())
-            self.session_buffers.pop(container, None)
+        with self._stream_lock(container):
+            sessions_to_cleanup = self.session_buffers.pop(container, None) or {}
 
         # Clean up session activity tracking
         for session in sessions_to_cleanup:
@@ -1306,11 +1661,19 @@ class boxctld:
 
         # Clean up container state
         with self.container_state_lock:
-            self.container_state.pop(container, None)
+            if container in self.container_state:
+                new_states = dict(self.container_state)
+                del new_states[container]
+                self.container_state = MappingProxyType(new_states)
+                self._worktrees_gen += 1
 
         # Clean up session metadata
         with self.session_metadata_lock:
-            self.session_metadata.pop(container, None)
+            if container in self.session_metadata:
+                new_metadata = dict(self.session_metadata)
+                del new_metadata[container]
+                self.session_metadata = MappingProxyType(new_metadata)
+                self._sessions_gen += 1
 
         # Clean up active notifications for this container (prevent memory leak)
         with self.active_notifications_lock:
@@ -1325,8 +1688,6 @@ class boxctld:
 
         Returns True if IP changed and rebind is needed.
         """
-        from boxctl.host_config import get_tailscale_ip
-
         # Only check if tailscale is configured (hosts or bind_addresses)
         if not self.config.uses_tailscale():
             return False
@@ -1336,6 +1697,7 @@ class boxctld:
         if expected_ip != self._current_tailscale_ip:
             old_ip = self._current_tailscale_ip
             self._current_tailscale_ip = expected_ip
+            self._bind_addresses_cache = None
 
             if old_ip is None and expected_ip is not None:
                 logger.info(f"Tailscale IP now available: {expected_ip}")
@@ -1349,25 +1711,79 @@ class boxctld:
 
         return False
 
+    def _run_tailscale_check(self) -> bool:
+        """Probe the Tailscale IP once, asking the web server to rebind on change.
+
+        Returns True if the IP changed.
+        """
+        try:
+            if self._check_tailscale_ip():
+                # Signal web server to restart
+                if self._web_server_restart_event:
+                    self._web_server_restart_event.set()
+                return True
+        except OSError as e:
+            logger.error(f"Tailscale monitor error: {e}")
+        return False
+
     def _tailscale_monitor_loop(self) -> None:
-        """Background thread loop that checks for Tailscale IP changes."""
+        """Background thread loop that checks for Tailscale IP changes.
+
+        On Linux the loop sleeps until netlink reports an interface address
+        change, then probes. A probe result is trusted for check_interval_seconds,
+        so bursts of unrelated address changes (e.g. container veths) cost at
+        most one probe per interval. A probe is also forced every
+        force_check_interval_seconds in case an event was missed.
+        """
         config = self.config.get("tailscale_monitor", default={})
         check_interval = float(config.get("check_interval_seconds", 30.0))
+        watch = self._tailscale_ifaddr_watch
+        if watch is None or self._tailscale_wakeup is None:
+            self._tailscale_poll_loop(config, check_interval)
+            return
 
-        while self.tailscale_monitor_running:
-            try:
-                if self._check_tailscale_ip():
-                    # Signal web server to restart
-                    if self._web_server_restart_event:
-                        self._web_server_restart_event.set()
-            except OSError as e:
-                logger.error(f"Tailscale monitor error: {e}")
-            time.sleep(check_interval)
+        force_interval = max(
+            check_interval, float(config.get("force_check_interval_seconds", 300.0))
+        )
+        last_check = time.monotonic()
+        with selectors.DefaultSelector() as sel:
+            sel.register(watch, selectors.EVENT_READ)
+            sel.register(self._tailscale_wakeup[0], selectors.EVENT_READ)
+            while not self._tailscale_stop_event.is_set():
+                timeout = max(0.0, last_check + force_interval - time.monotonic())
+                events = sel.select(timeout)
+                if self._tailscale_stop_event.is_set():
+                    break
+                if events:
+                    settle = max(
+                        IFADDR_SETTLE_SECONDS, last_check + check_interval - time.monotonic()
+                    )
+                    if self._tailscale_stop_event.wait(settle):
+                        break
+                    _drain_socket(watch)
+                self._run_tailscale_check()
+                last_check = time.monotonic()
+
+    def _tailscale_poll_loop(self, config: dict, check_interval: float) -> None:
+        """Polling fallback for platforms without netlink.
+
+        The check interval doubles (up to max_interval_seconds) for every check
+        that finds the IP unchanged, and drops back to check_interval_seconds
+        as soon as it changes.
+        """
+        max_interval = max(check_interval, float(config.get("max_interval_seconds", 600.0)))
+        stable_cycles = 0
+
+        while not self._tailscale_stop_event.is_set():
+            if self._run_tailscale_check():
+                stable_cycles = 0
+            else:
+                stable_cycles += 1
+            interval = min(max_interval, check_interval * (2 ** min(stable_cycles, 6)))
+            self._tailscale_stop_event.wait(interval)
 
     def _start_tailscale_monitor(self) -> None:
         """Start the Tailscale IP monitor thread."""
-        from boxctl.host_config import get_tailscale_ip
-
         # Only start if "tailscale" is configured (hosts or bind_addresses)
         if not self.config.uses_tailscale():
             return
@@ -1378,8 +1794,14 @@ class boxctld:
 
         # Initialize current IP
         self._current_tailscale_ip = get_tailscale_ip()
+        self._bind_addresses_cache = None
 
-        self.tailscale_monitor_running = True
+        self._tailscale_stop_event.clear()
+        self._tailscale_ifaddr_watch = _open_ifaddr_watch()
+        if self._tailscale_ifaddr_watch is not None:
+            self._tailscale_wakeup = socket.socketpair()
+        else:
+            logger.debug("Netlink unavailable, polling for Tailscale IP changes")
         self.tailscale_monitor_thread = threading.Thread(
             target=self._tailscale_monitor_loop, daemon=True, name="tailscale-monitor"
         )
@@ -1388,68 +1810,86 @@ class boxctld:
 
     def _stop_tailscale_monitor(self) -> None:
         """Stop the Tailscale IP monitor thread."""
-        if self.tailscale_monitor_thread and self.tailscale_monitor_running:
-            self.tailscale_monitor_running = False
+        if self.tailscale_monitor_thread and not self._tailscale_stop_event.is_set():
+            self._tailscale_stop_event.set()
+            if self._tailscale_wakeup is not None:
+                try:
+                    self._tailscale_wakeup[1].send(b"\0")
+                except OSError:
+                    pass
             self.tailscale_monitor_thread.join(timeout=2.0)
+            self.tailscale_monitor_thread = None
+            for sock in (self._tailscale_ifaddr_watch, *(self._tailscale_wakeup or ())):
+                if sock is not None:
+                    sock.close()
+            self._tailscale_ifaddr_watch = None
+            self._tailscale_wakeup = None
             logger.info("Tailscale monitor stopped")
 
+    def _stream_lock(self, container: str) -> threading.Lock:
+        """Return the shard lock guarding a container's stream buffers."""
+        return self._stream_locks[hash(container) & (STREAM_SHARDS - 1)]
+
     def get_session_buffer(self, container: str, session: str) -> Optional[str]:
-        """Get cached buffer for a session (thread-safe)."""
-        with self.stream_lock:
-            data = self.session_buffers.get(container, {}).get(session)
-            if data:
-                return data.get("buffer")
-            return None
+        """Get cached buffer for a session (thread-safe, lock-free)."""
+        sessions = self.session_buffers.get(container)
+        snapshot = sessions.get(session) if sessions else None
+        return snapshot.buffer if snapshot else None
 
     def get_session_cursor(self, container: str, session: str) -> tuple:
-        """Get cached cursor position and pane size for a session (thread-safe).
+        """Get cached cursor position and pane size for a session (thread-safe, lock-free).
 
         Returns: (cursor_x, cursor_y, pane_width, pane_height)
         """
-        with self.stream_lock:
-            data = self.session_buffers.get(container, {}).get(session)
-            if data:
-                return (
-                    data.get("cursor_x", 0),
-                    data.get("cursor_y", 0),
-                    data.get("pane_width", 0),
-                    data.get("pane_height", 0),
-                )
-            return (0, 0, 0, 0)
+        sessions = self.session_buffers.get(container)
+        snapshot = sessions.get(session) if sessions else None
+        if snapshot:
+            return (snapshot.cursor_x, snapshot.cursor_y, snapshot.pane_width, snapshot.pane_height)
+        return (0, 0, 0, 0)
 
     def subscribe_to_stream(self, container: str, session: str, callback) -> None:
         """Subscribe to stream updates for a session.
 
-        The callback will be called with stream data dict whenever new data arrives.
-        Callbacks should be fast and non-blocking (e.g., put to asyncio queue).
+        The callback will be called with the session's SessionSnapshot whenever
+        new data arrives. Callbacks should be fast and non-blocking (e.g., put to
+        asyncio queue). A queue.Queue or queue.SimpleQueue can be passed instead of a callback;
+        frames are put to it without blocking and dropped while it is full.
         """
+        deliver = _stream_subscriber(callback)
         key = (container, session)
         with self.subscribers_lock:
-            if key not in self.stream_subscribers:
-                self.stream_subscribers[key] = []
-            self.stream_subscribers[key].append(callback)
+            self.stream_subscribers[key] = self.stream_subscribers.get(key, ()) + (deliver,)
 
     def unsubscribe_from_stream(self, container: str, session: str, callback) -> None:
         """Unsubscribe from stream updates."""
+        deliver = _stream_subscriber(callback)
         key = (container, session)
         with self.subscribers_lock:
-            if key in self.stream_subscribers:
-                try:
-                    self.stream_subscribers[key].remove(callback)
-                    if not self.stream_subscribers[key]:
-                        del self.stream_subscribers[key]
-                except ValueError:
-                    pass  # Callback not found
+            callbacks = list(self.stream_subscribers.get(key, ()))
+            try:
+                callbacks.remove(deliver)
+            except ValueError:
+                return  # Callback not found
+            if callbacks:
+                self.stream_subscribers[key] = tuple(callbacks)
+            else:
+                del self.stream_subscribers[key]
 
-    def _notify_stream_subscribers(self, container: str, session: str, data: dict) -> None:
+    def _notify_stream_subscribers(
+        self, container: str, session: str, data: SessionSnapshot
+    ) -> None:
         """Notify all subscribers of new stream data."""
-        key = (container, session)
-        with self.subscribers_lock:
-            callbacks = self.stream_subscribers.get(key, []).copy()
+        # Most frames have no subscriber at all; skip the lookup for them
+        if not self.stream_subscribers:
+            return
+        # Subscriber tuples are immutable snapshots, no lock or copy needed
+        callbacks = self.stream_subscribers.get((container, session), ())
 
         for callback in callbacks:
             try:
                 callback(data)
+            except queue.Full:
+                pass  # Slow queue subscriber; it gets the next frame instead
             except Exception as e:
                 logger.error(f"Stream subscriber callback error: {e}")
 
@@ -1467,8 +1907,8 @@ class boxctld:
     def _handle_request(self, raw: bytes) -> Dict[str, Any]:
         """Handle action-based requests from the Unix socket."""
         try:
-            payload = json.loads(raw.decode("utf-8"))
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            payload = decode_json(raw)
+        except (JSONDecodeError, UnicodeDecodeError) as e:
             logger.warning(f"JSON parse error: {e}")
             return {"ok": False, "error": "invalid_json"}
 
@@ -1480,12 +1920,126 @@ class boxctld:
         if not action:
             logger.warning(f"Message without action: {list(payload.keys())}")
             return {"ok": False, "error": "missing_action"}
-        logger.debug(f"Action={action}")
-        handler = self.handlers.get(action)
+        # Non-string actions (lists, objects) are unhashable; reject them
+        # before the handler lookup instead of failing the connection
+        handler = self._handlers.get(action) if isinstance(action, str) else None
         if handler is None:
             return {"ok": False, "error": "unknown_action"}
+        logger.debug(f"Action={action}")
         return handler(payload)
 
+    def _handle_sighup(self, signum, frame) -> None:
+        """Reload host config and re-resolve cached paths."""
+        logger.info("Received SIGHUP, reloading config")
+        self.config._config = self.config._load()
+        self._resolve_notify_paths()
+        self._bind_addresses_cache = None
+
+    def _acceptor_loop(self, server: socket.socket, batch: int) -> None:
+        """Accept control socket connections and hand them to the request pool.
+
+        The listening socket is non-blocking; each readiness wakeup accepts up
+        to batch pending connections before submitting them. With batch=1 the
+        acceptor goes straight back to polling, and since readiness is
+        level-triggered the remaining connections wake whichever acceptor is
+        free, instead of one greedy thread taking the whole burst.
+        """
+        with selectors.DefaultSelector() as selector:
+            selector.register(server, selectors.EVENT_READ)
+            while True:
+                try:
+                    selector.select()
+                    accepted = []
+                    while len(accepted) < batch:
+                        try:
+                            conn, _ = server.accept()
+                        except BlockingIOError:
+                            break  # Queue drained, or another acceptor took it
+                        accepted.append(conn)
+
+                    for conn in accepted:
+                        self._request_pool.submit(self._handle_connection, conn)
+
+                except Exception as e:
+                    if server.fileno() == -1:
+                        return  # Listening socket closed during shutdown
+                    # Traceback goes to the log file only, not stderr
+                    logger.exception(f"Connection error: {e}")
+
+    def _read_request_line(self, conn: socket.socket, pending: bytearray, wait: float) -> bool:
+        """Receive into pending until it holds a complete request line.
+
+        Waits up to `wait` seconds for the request to start, then allows
+        5 seconds for the rest of it. Returns False on EOF, timeout or an
+        oversized request.
+        """
+        deadline = None
+        try:
+            conn.settimeout(wait)
+            while True:
+                chunk = conn.recv(RECV_CHUNK_SIZE)
+                if not chunk:
+                    break
+                pending += chunk
+                if b"\n" in chunk:
+                    return True
+                if len(pending) > MAX_MESSAGE_SIZE:
+                    logger.warning(f"Request exceeds {MAX_MESSAGE_SIZE} bytes, closing connection")
+                    return False
+                if deadline is None:
+                    deadline = time.monotonic() + 5.0  # Max 5 seconds to receive the rest
+                    conn.settimeout(2.0)  # Timeout per recv call
+                elif time.monotonic() >= deadline:
+                    break
+        except socket.timeout:
+            pass
+        if pending.strip():
+            logger.warning(f"Connection timed out waiting for newline, got {len(pending)} bytes")
+        return False
+
+    def _handle_connection(self, conn: socket.socket) -> None:
+        """Serve request lines from an accepted connection until the client closes it.
+
+        Every request line gets one response line, in order, so a client can
+        keep its connection open for further requests. One-shot clients just
+        close after reading their response.
+        """
+        try:
+            # A bytearray grows in place instead of copying on each chunk
+            pending = bytearray()
+            wait = 2.0  # First request must start promptly
+            while True:
+                line_end = pending.find(b"\n")
+                if line_end < 0:
+                    if not self._read_request_line(conn, pending, wait):
+                        return
+                    wait = KEEPALIVE_IDLE_TIMEOUT
+                    continue
+
+                line = pending[:line_end]
+                del pending[: line_end + 1]
+                if not line.strip():
+                    continue
+                response = self._handle_request(line)
+                try:
+                    conn.settimeout(5.0)  # Timeout for send
+                    conn.sendall(encode_json(response) + b"\n")
+                except (
+                    BrokenPipeError,
+                    ConnectionResetError,
+                    OSError,
+                    socket.timeout,
+                ) as e:
+                    logger.warning(f"Send failed: {e}")
+                    return
+        except Exception as e:
+            logger.error(f"Request handler error: {e}")
+        finally:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
     def serve_forever(self) -> None:
         self.socket_path.parent.mkdir(parents=True, exist_ok=True)
         if self.socket_path.exists():
@@ -1494,8 +2048,10 @@ class boxctld:
         with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
             server.bind(str(self.socket_path))
             os.chmod(self.socket_path, 0o600)
-            server.listen(5)
+            server.listen(SOCKET_BACKLOG)
+            server.setblocking(False)
             logger.info("Listening on socket")
+            signal.signal(signal.SIGHUP, self._handle_sighup)
 
             # Start Tailscale IP monitor
             self._start_tailscale_monitor()
@@ -1504,78 +2060,32 @@ class boxctld:
             self.ssh_tunnel_server.start()
             logger.info(f"SSH tunnel server listening on {_ssh_socket_path()}")
 
+            accept_mode = self.config.get("network", "accept_mode", default="greedy")
+            if accept_mode not in ("greedy", "single"):
+                logger.warning(f"Unknown network.accept_mode {accept_mode!r}, using greedy")
+                accept_mode = "greedy"
+            batch = 1 if accept_mode == "single" else ACCEPT_BATCH
+
+            # The main thread is acceptor 0
+            for i in range(1, ACCEPTOR_THREADS):
+                threading.Thread(
+                    target=self._acceptor_loop,
+                    args=(server, batch),
+                    daemon=True,
+                    name=f"boxctld-accept-{i}",
+                ).start()
+
             try:
-                while True:
-                    try:
-                        conn, _ = server.accept()
-                        conn.settimeout(2.0)  # Timeout per recv call
-
-                        # Read request data
-                        data = b""
-                        read_start = time.time()
-                        max_read_time = 5.0  # Max 5 seconds to receive initial data
-                        try:
-                            while time.time() - read_start < max_read_time:
-                                chunk = conn.recv(4096)
-                                if not chunk:
-                                    break
-                                data += chunk
-                                if b"\n" in data:
-                                    break
-                        except socket.timeout:
-                            pass
-
-                        # Check if we timed out without getting complete data
-                        if data and b"\n" not in data:
-                            logger.warning(
-                                f"Connection timed out waiting for newline, got {len(data)} bytes"
-                            )
-                            conn.close()
-                            continue
-
-                        if not data.strip():
-                            conn.close()
-                            continue
-
-                        # Handle request/response - run in thread to avoid blocking
-                        def handle_request(c, d):
-                            try:
-                                responses = []
-                                for line in d.splitlines():
-                                    if not line.strip():
-                                        continue
-                                    responses.append(self._handle_request(line))
-                                if not responses:
-                                    responses = [{"ok": False, "error": "empty_request"}]
-                                try:
-                                    c.settimeout(5.0)  # Timeout for send
-                                    c.sendall((json.dumps(responses[-1]) + "\n").encode("utf-8"))
-                                except (
-                                    BrokenPipeError,
-                                    ConnectionResetError,
-                                    OSError,
-                                    socket.timeout,
-                                ) as e:
-                                    logger.warning(f"Send failed: {e}")
-                            except Exception as e:
-                                logger.error(f"Request handler error: {e}")
-                            finally:
-                                try:
-                                    c.close()
-                                except Exception:
-                                    pass
-
-                        t = threading.Thread(target=handle_request, args=(conn, data), daemon=True)
-                        t.start()
-
-                    except Exception as e:
-                        logger.error(f"Connection error: {e}")
-                        traceback.print_exc()
+                self._acceptor_loop(server, batch)
             except KeyboardInterrupt:
                 logger.info("Shutting down...")
             finally:
                 self._stop_tailscale_monitor()
                 self.ssh_tunnel_server.stop()
+                self._request_pool.shutdown(wait=False, cancel_futures=True)
+                self._aio_loop.call_soon_threadsafe(self._aio_loop.stop)
+                with self._notify_bus_lock:
+                    self._close_notify_bus()
 
 
 # Global proxy instance for web server access
@@ -1609,8 +2119,9 @@ def send_input(container: str, session: str, keys: str, literal: bool = True) ->
 def subscribe_to_stream(container: str, session: str, callback) -> bool:
     """Subscribe to stream updates for a session (for web server use).
 
-    The callback will be called with stream data dict whenever new data arrives.
+    The callback will be called with a SessionSnapshot whenever new data arrives.
     Callbacks should be fast and non-blocking (e.g., put to asyncio queue).
+    A queue.Queue may be passed instead; see boxctld.subscribe_to_stream.
 
     Returns True if subscription was successful.
     """
@@ -1664,16 +2175,7 @@ def remove_host_port(host_port: int) -> Tuple[bool, str]:
         return False, "boxctld not running"
 
     # Find which container has this port forwarded
-    container = None
-    with _instance.ssh_tunnel_server.connections_lock:
-        for cont_name, conn in _instance.ssh_tunnel_server.connections.items():
-            for fwd in conn.remote_forwards:
-                if fwd.get("host_port") == host_port:
-                    container = cont_name
-                    break
-            if container:
-                break
-
+    container = _instance.ssh_tunnel_server.find_remote_forward(host_port)
     if not container:
         return False, f"no forward found for host port {host_port}"
 
@@ -1695,18 +2197,23 @@ def get_host_ports() -> list:
     if not _instance or not _instance.ssh_tunnel_server:
         return []
 
-    result = []
     with _instance.ssh_tunnel_server.connections_lock:
-        for container, conn in _instance.ssh_tunnel_server.connections.items():
-            for fwd in conn.remote_forwards:
-                result.append(
-                    {
-                        "host_port": fwd.get("host_port", 0),
-                        "container_port": fwd.get("container_port", fwd.get("host_port", 0)),
-                        "container": container,
-                        "active": True,
-                    }
-                )
+        snapshot = [
+            (container, tuple(conn.remote_forwards))
+            for container, conn in _instance.ssh_tunnel_server.connections.items()
+        ]
+
+    result = []
+    for container, remote_forwards in snapshot:
+        for fwd in remote_forwards:
+            result.append(
+                {
+                    "host_port": fwd.get("host_port", 0),
+                    "container_port": fwd.get("container_port", fwd.get("host_port", 0)),
+                    "container": container,
+                    "active": True,
+                }
+            )
     return result
 
 
@@ -1722,12 +2229,7 @@ def is_host_port_active(host_port: int) -> bool:
     if not _instance or not _instance.ssh_tunnel_server:
         return False
 
-    with _instance.ssh_tunnel_server.connections_lock:
-        for conn in _instance.ssh_tunnel_server.connections.values():
-            for fwd in conn.remote_forwards:
-                if fwd.get("host_port") == host_port:
-                    return True
-    return False
+    return _instance.ssh_tunnel_server.find_remote_forward(host_port) is not None
 
 
 def get_tunnel_stats() -> dict:
@@ -1739,12 +2241,11 @@ def get_tunnel_stats() -> dict:
     if not _instance or not _instance.ssh_tunnel_server:
         return {"ssh_tunnel": {"connected_containers": 0, "total_forwards": 0}}
 
-    connected = 0
-    forwards = 0
     with _instance.ssh_tunnel_server.connections_lock:
-        connected = len(_instance.ssh_tunnel_server.connections)
-        for conn in _instance.ssh_tunnel_server.connections.values():
-            forwards += len(conn.remote_forwards) + len(conn.local_forwards)
+        conns = list(_instance.ssh_tunnel_server.connections.values())
+
+    connected = len(conns)
+    forwards = sum(len(conn.remote_forwards) + len(conn.local_forwards) for conn in conns)
 
     return {
         "ssh_tunnel": {
@@ -1788,18 +2289,19 @@ def get_session_metadata(
     now = time.time()
     result = {}
 
-    with _instance.session_metadata_lock:
-        if container:
-            meta = _instance.session_metadata.get(container)
-            if meta:
-                if now - meta.get("updated_at", 0) <= max_age:
-                    result[container] = meta.get("sessions", [])
-                # Stale data - return None for this container
-        else:
-            for cont, meta in _instance.session_metadata.items():
-                if now - meta.get("updated_at", 0) <= max_age:
-                    result[cont] = meta.get("sessions", [])
-                # Skip stale containers
+    # Copy-on-write snapshot, no lock needed for reading
+    snapshot = _instance.session_metadata
+    if container:
+        meta = snapshot.get(container)
+        if meta:
+            if now - meta.get("updated_at", 0) <= max_age:
+                result[container] = meta.get("sessions", [])
+            # Stale data - return None for this container
+    else:
+        for cont, meta in snapshot.items():
+            if now - meta.get("updated_at", 0) <= max_age:
+                result[cont] = meta.get("sessions", [])
+            # Skip stale containers
 
     return result if result else None
 
@@ -1867,7 +2369,6 @@ def get_usage_status() -> Optional[Dict[str, Any]]:
 def run_boxctld(socket_path: Optional[str] = None) -> None:
     """Run the boxctl daemon, optionally with web server."""
     global _instance
-    import asyncio
 
     path = Path(socket_path) if socket_path else _default_socket_path()
     daemon = boxctld(path)
@@ -1879,15 +2380,48 @@ def run_boxctld(socket_path: Optional[str] = None) -> None:
     # Create restart event for Tailscale monitor to signal web server restart
     web_restart_event = threading.Event()
     daemon._web_server_restart_event = web_restart_event
+    # Set on daemon shutdown so the restart monitor exits instead of restarting
+    web_stop_event = threading.Event()
 
     # Track running web server state
     web_server_state = {
         "servers": [],  # List of uvicorn.Server instances
-        "thread": None,
-        "loop": None,
-        "shutdown_event": None,
+        "task": None,  # Future for the coroutine serving them
+        "loop": None,  # Web server loop, kept running across restarts
     }
 
+    def get_web_loop():
+        """Return the web server loop, starting its thread on first use."""
+        loop = web_server_state["loop"]
+        if loop is None:
+            # Server.serve() runs on whatever loop we give it, so uvicorn's
+            # own uvloop selection never applies here; pick it ourselves.
+            # (uvloop and httptools come with uvicorn[standard], and
+            # uvicorn's http="auto" already prefers httptools.)
+            try:
+                import uvloop
+
+                loop = uvloop.new_event_loop()
+            except ImportError:
+                loop = asyncio.new_event_loop()
+
+            def run_loop():
+                asyncio.set_event_loop(loop)
+                loop.run_forever()
+
+            threading.Thread(target=run_loop, daemon=True, name="web-server").start()
+            web_server_state["loop"] = loop
+        return loop
+
+    async def serve_all(servers):
+        try:
+            await asyncio.gather(*[s.serve() for s in servers])
+        except (Exception, SystemExit) as e:
+            # uvicorn exits via SystemExit when it can't bind; keep it from
+            # stopping the shared loop so a later restart can still run
+            if not any(s.should_exit for s in servers):
+                logger.error(f"Web server error: {e!r}")
+
     def start_web_server():
         """Start web server with current host bindings."""
         if not web_config.get("enabled", True):
@@ -1903,38 +2437,16 @@ def run_boxctld(socket_path: Optional[str] = None) -> None:
             port = web_config.get("port", 8080)
             log_level = web_config.get("log_level", "info")
 
-            # Create shutdown event for this server instance
-            shutdown_event = threading.Event()
-            web_server_state["shutdown_event"] = shutdown_event
-
-            def run_web_server():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                web_server_state["loop"] = loop
-
-                async def serve_all():
-                    servers = []
-                    for host in hosts:
-                        logger.info(f"Starting web server on {host}:{port}")
-                        uvi_config = uvicorn.Config(app, host=host, port=port, log_level=log_level)
-                        server = uvicorn.Server(uvi_config)
-                        servers.append(server)
-                        web_server_state["servers"].append(server)
+            servers = []
+            for host in hosts:
+                logger.info(f"Starting web server on {host}:{port}")
+                uvi_config = uvicorn.Config(app, host=host, port=port, log_level=log_level)
+                servers.append(uvicorn.Server(uvi_config))
 
-                    # Run all servers
-                    await asyncio.gather(*[s.serve() for s in servers])
-
-                try:
-                    loop.run_until_complete(serve_all())
-                except Exception as e:
-                    if not shutdown_event.is_set():
-                        logger.error(f"Web server error: {e}")
-                finally:
-                    loop.close()
-
-            thread = threading.Thread(target=run_web_server, daemon=True, name="web-server")
-            thread.start()
-            web_server_state["thread"] = thread
+            web_server_state["servers"] = servers
+            web_server_state["task"] = asyncio.run_coroutine_threadsafe(
+                serve_all(servers), get_web_loop()
+            )
             return True
 
         except ImportError as e:
@@ -1944,38 +2456,36 @@ def run_boxctld(socket_path: Optional[str] = None) -> None:
         return False
 
     def stop_web_server():
-        """Stop running web server gracefully."""
-        if web_server_state["shutdown_event"]:
-            web_server_state["shutdown_event"].set()
-
+        """Stop running web servers gracefully; the loop stays up for a restart."""
         # Signal all servers to exit
         for server in web_server_state["servers"]:
             server.should_exit = True
 
-        # Wait briefly for thread to finish
-        if web_server_state["thread"]:
-            web_server_state["thread"].join(timeout=3.0)
+        # serve() returns once the listening sockets are closed, so the ports
+        # are free for the next start as soon as this completes
+        if web_server_state["task"]:
+            try:
+                web_server_state["task"].result(timeout=3.0)
+            except Exception as e:
+                logger.warning(f"Web server did not stop cleanly: {e!r}")
 
         # Reset state
         web_server_state["servers"] = []
-        web_server_state["thread"] = None
-        web_server_state["loop"] = None
-        web_server_state["shutdown_event"] = None
+        web_server_state["task"] = None
 
     def restart_monitor():
         """Monitor thread that handles web server restart requests."""
         while True:
             web_restart_event.wait()
             web_restart_event.clear()
+            if web_stop_event.is_set():
+                return
 
             logger.info("Restarting web server due to binding changes...")
 
             # Stop old server
             stop_web_server()
 
-            # Brief delay to allow port release
-            time.sleep(1)
-
             # Start new server with fresh bindings
             start_web_server()
 
@@ -1994,6 +2504,8 @@ def run_boxctld(socket_path: Optional[str] = None) -> None:
     except KeyboardInterrupt:
         logger.info("Shutting down...")
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
-        traceback.print_exc()
+        logger.exception(f"Fatal error: {e}")
         sys.exit(1)
+    finally:
+        web_stop_event.set()
+        web_restart_event.set()  # Wake the restart monitor so it sees the stop
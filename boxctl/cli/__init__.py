@@ -4,124 +4,199 @@
 
 """boxctl CLI package."""
 
+import importlib
+import io
+import os
+import sys
+
 import click
 
-from boxctl.container import ContainerManager
-
-from boxctl.cli.helpers import console
-from boxctl.cli.helpers import (
-    BANNER,
-    LOG_DOC_NAME,
-    WORKSPACES_CONFIG_NAME,
-    WORKSPACES_MOUNT_ROOT,
-    _attach_tmux_session,
-    _complete_session_name,
-    _ensure_container_running,
-    _get_tmux_sessions,
-    _get_tmux_socket,
-    _load_codex_config,
-    _load_workspaces_config,
-    _resolve_container_and_args,
-    _resolve_tmux_prefix,
-    _run_agent_command,
-    _sanitize_mount_name,
-    _sanitize_tmux_name,
-    _save_workspaces_config,
-)
-from boxctl.cli.helpers.completions import (
-    _complete_project_name,
-    _complete_connect_session,
+
+class LazyGroup(click.Group):
+    """Click group that imports command modules only when a command is looked up.
+
+    lazy_subcommands maps a command name to "module:attribute". Command modules
+    define plain click commands and don't import this package; the map is the
+    only place they are registered.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        spec = self.lazy_subcommands.get(cmd_name)
+        if spec is not None and cmd_name not in self.commands:
+            module_name, attr = spec.split(":")
+            command = getattr(importlib.import_module(module_name), attr)
+            self.add_command(command, name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+CLI_VERSION = "0.3.1"
+# Environment variable set by the shell completion scripts (bin/completions)
+COMPLETE_VAR = "_BOXCTL_COMPLETE"
+
+# Commands defined in boxctl.cli.commands, imported on first use
+_COMMANDS = "boxctl.cli.commands"
+LAZY_SUBCOMMANDS = {
+    "claude": f"{_COMMANDS}.agents:claude",
+    "superclaude": f"{_COMMANDS}.agents:superclaude",
+    "codex": f"{_COMMANDS}.agents:codex",
+    "supercodex": f"{_COMMANDS}.agents:supercodex",
+    "gemini": f"{_COMMANDS}.agents:gemini",
+    "supergemini": f"{_COMMANDS}.agents:supergemini",
+    "qwen": f"{_COMMANDS}.agents:qwen",
+    "superqwen": f"{_COMMANDS}.agents:superqwen",
+    "base": f"{_COMMANDS}.base:base",
+    "devices": f"{_COMMANDS}.devices:devices",
+    "docker": f"{_COMMANDS}.docker:docker",
+    "logs": f"{_COMMANDS}.logs:logs",
+    "mcp": f"{_COMMANDS}.mcp:mcp",
+    "mcps": f"{_COMMANDS}.mcp:mcp",
+    "network": f"{_COMMANDS}.network:network",
+    "packages": f"{_COMMANDS}.packages:packages_group",
+    "ports": f"{_COMMANDS}.ports:ports",
+    "project": f"{_COMMANDS}.project:project",
+    "quick": f"{_COMMANDS}.quick:quick",
+    "q": f"{_COMMANDS}.quick:quick_alias",
+    "run": f"{_COMMANDS}.run:run_command",
+    "service": f"{_COMMANDS}.service:service",
+    "session": f"{_COMMANDS}.sessions:session_group",
+    "skill": f"{_COMMANDS}.skill:skill",
+    "skills": f"{_COMMANDS}.skill:skill",
+    "usage": f"{_COMMANDS}.usage:usage",
+    "workspace": f"{_COMMANDS}.workspace:workspace",
+    "worktree": f"{_COMMANDS}.worktree:worktree_group",
+    "config": f"{_COMMANDS}.project:config_group",
+    # Top-level shortcuts for common group subcommands
+    "start": f"{_COMMANDS}.project:start",
+    "stop": f"{_COMMANDS}.project:stop",
+    "list": f"{_COMMANDS}.project:list",
+    "ps": f"{_COMMANDS}.project:list",
+    "shell": f"{_COMMANDS}.project:shell",
+    "connect": f"{_COMMANDS}.project:connect",
+    "info": f"{_COMMANDS}.project:info",
+    "remove": f"{_COMMANDS}.project:remove",
+    "cleanup": f"{_COMMANDS}.project:cleanup",
+    "rebase": f"{_COMMANDS}.project:rebase",
+    "init": f"{_COMMANDS}.project:init",
+    "setup": f"{_COMMANDS}.project:setup",
+    "reconfigure": f"{_COMMANDS}.project:reconfigure",
+    "rebuild": f"{_COMMANDS}.base:rebuild",
+}
+
+
+# Command overview printed by a bare `boxctl`
+_OVERVIEW_GROUPS = (
+    (
+        "Agents",
+        (
+            ("claude", "Run Claude Code"),
+            ("superclaude", "Run Claude Code (auto-approve)"),
+            ("codex", "Run Codex"),
+            ("supercodex", "Run Codex (auto-approve)"),
+            ("gemini", "Run Gemini"),
+            ("supergemini", "Run Gemini (auto-approve)"),
+            ("run", "Run agent non-interactively (for scripting)"),
+        ),
+    ),
+    (
+        "Quick Commands",
+        (
+            ("quick/q", "Mobile-friendly TUI menu"),
+            ("start", "Start container for current project"),
+            ("stop", "Stop container"),
+            ("list/ps", "List containers"),
+            ("shell", "Open shell in container"),
+            ("connect", "Connect to container/session"),
+            ("info", "Show container details"),
+            ("rebase", "Rebase project container to current base"),
+            ("remove", "Remove container"),
+            ("cleanup", "Remove stopped containers"),
+            ("setup", "Initialize + configure interactively"),
+            ("init", "Initialize .boxctl/ directory"),
+            ("reconfigure", "Change agent/project settings"),
+            ("rebuild", "Rebuild base Docker image"),
+        ),
+    ),
+    (
+        "Command Groups",
+        (
+            ("project", "Lifecycle (init/start/stop/rebase/remove/info/list)"),
+            ("session", "Tmux sessions (new/list/attach/remove/rename)"),
+            ("worktree", "Git worktrees (ls/add/remove/prune)"),
+            ("network", "Connect to containers (list/available/connect/disconnect)"),
+            ("base", "Base image (rebuild)"),
+        ),
+    ),
+    (
+        "Libraries & Config",
+        (
+            ("mcp/mcps", "MCP servers (manage/list/show/add/remove)"),
+            ("skill/skills", "Skills (manage/list/show/add/remove)"),
+            ("workspace", "Workspace mounts (list/add/remove)"),
+            ("packages", "Package management (list/add/remove)"),
+            ("ports", "Port forwarding (list/add/remove/status)"),
+            ("devices", "Device passthrough (list/add/remove/choose)"),
+            ("docker", "Docker socket access (enable/disable/status)"),
+            ("config", "Config utilities (migrate)"),
+            ("usage", "Agent rate limits (status/probe/reset/fallback)"),
+            ("logs", "Conversation logs (list/export/show)"),
+        ),
+    ),
+    (
+        "Service",
+        (("service", "Host daemon (install/start/stop/status/logs/serve)"),),
+    ),
 )
+_OVERVIEW_WIDTH = max(len(name) for _, rows in _OVERVIEW_GROUPS for name, _ in rows)
 
+# Rendered overview text; built on first use
+_overview_text: str | None = None
 
-@click.group(invoke_without_command=True)
-@click.version_option(version="0.3.1", prog_name="boxctl")
-def cli():
-    """boxctl - Secure, isolated Docker environment for Claude Code."""
-    ctx = click.get_current_context()
-    if ctx.invoked_subcommand is None:
-        click.echo("Usage: boxctl [OPTIONS] COMMAND [ARGS]...\n")
 
-        def _print_table(title: str, rows: list[tuple[str, str]], width: int) -> None:
-            click.echo(f"{title}:")
+def _get_overview_text() -> str:
+    """Return the command overview shown when boxctl runs without a subcommand."""
+    global _overview_text
+    if _overview_text is None:
+        out = io.StringIO()
+        out.write("Usage: boxctl [OPTIONS] COMMAND [ARGS]...\n\n")
+        for title, rows in _OVERVIEW_GROUPS:
+            out.write(f"{title}:\n")
             for name, desc in rows:
-                click.echo(f"  {name.ljust(width)}  {desc}")
-            click.echo("")
-
-        groups = [
-            (
-                "Agents",
-                [
-                    ("claude", "Run Claude Code"),
-                    ("superclaude", "Run Claude Code (auto-approve)"),
-                    ("codex", "Run Codex"),
-                    ("supercodex", "Run Codex (auto-approve)"),
-                    ("gemini", "Run Gemini"),
-                    ("supergemini", "Run Gemini (auto-approve)"),
-                    ("run", "Run agent non-interactively (for scripting)"),
-                ],
-            ),
-            (
-                "Quick Commands",
-                [
-                    ("quick/q", "Mobile-friendly TUI menu"),
-                    ("start", "Start container for current project"),
-                    ("stop", "Stop container"),
-                    ("list/ps", "List containers"),
-                    ("shell", "Open shell in container"),
-                    ("connect", "Connect to container/session"),
-                    ("info", "Show container details"),
-                    ("rebase", "Rebase project container to current base"),
-                    ("remove", "Remove container"),
-                    ("cleanup", "Remove stopped containers"),
-                    ("setup", "Initialize + configure interactively"),
-                    ("init", "Initialize .boxctl/ directory"),
-                    ("reconfigure", "Change agent/project settings"),
-                    ("rebuild", "Rebuild base Docker image"),
-                ],
-            ),
-            (
-                "Command Groups",
-                [
-                    ("project", "Lifecycle (init/start/stop/rebase/remove/info/list)"),
-                    ("session", "Tmux sessions (new/list/attach/remove/rename)"),
-                    ("worktree", "Git worktrees (ls/add/remove/prune)"),
-                    ("network", "Connect to containers (list/available/connect/disconnect)"),
-                    ("base", "Base image (rebuild)"),
-                ],
-            ),
-            (
-                "Libraries & Config",
-                [
-                    ("mcp/mcps", "MCP servers (manage/list/show/add/remove)"),
-                    ("skill/skills", "Skills (manage/list/show/add/remove)"),
-                    ("workspace", "Workspace mounts (list/add/remove)"),
-                    ("packages", "Package management (list/add/remove)"),
-                    ("ports", "Port forwarding (list/add/remove/status)"),
-                    ("devices", "Device passthrough (list/add/remove/choose)"),
-                    ("docker", "Docker socket access (enable/disable/status)"),
-                    ("config", "Config utilities (migrate)"),
-                    ("usage", "Agent rate limits (status/probe/reset/fallback)"),
-                    ("logs", "Conversation logs (list/export/show)"),
-                ],
-            ),
-            (
-                "Service",
-                [
-                    ("service", "Host daemon (install/start/stop/status/logs/serve)"),
-                ],
-            ),
-        ]
-
-        width = max(len(name) for _, rows in groups for name, _ in rows)
-        for title, rows in groups:
-            _print_table(title, rows, width)
-        click.echo("Use --help for full command details.")
-        return
+                out.write(f"  {name.ljust(_OVERVIEW_WIDTH)}  {desc}\n")
+            out.write("\n")
+        out.write("Use --help for full command details.")
+        _overview_text = out.getvalue()
+    return _overview_text
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS, invoke_without_command=True)
+@click.version_option(CLI_VERSION, "--version", "-V", prog_name="boxctl")
+@click.pass_context
+def cli(ctx: click.Context):
+    """boxctl - Secure, isolated Docker environment for Claude Code."""
+    if ctx.invoked_subcommand is None:
+        click.echo(_get_overview_text())
 
 
 def main():
     """Main entry point."""
+    args = sys.argv[1:]
+    # Fast paths that don't need Click's parser or any command module
+    if len(args) == 1 and args[0] in ("--version", "-V"):
+        click.echo(f"boxctl, version {CLI_VERSION}")
+        return
+    # Shell completion output is parsed by the shell, so it must not carry
+    # migration notices; completion also runs on every TAB
+    if COMPLETE_VAR in os.environ:
+        cli()
+        return
+
     # Auto-migrate legacy .agentbox → .boxctl in current project
     from boxctl.migrations.rename_migration import (
         auto_migrate_project_dir,
@@ -135,172 +210,12 @@ def main():
     warn_shell_rc_files()
     warn_legacy_systemd_service()
 
+    if not args:
+        click.echo(_get_overview_text())
+        return
     cli()
 
 
-from boxctl.cli.commands import agents  # noqa: E402,F401
-from boxctl.cli.commands import base  # noqa: E402,F401
-from boxctl.cli.commands import devices  # noqa: E402,F401
-from boxctl.cli.commands import docker  # noqa: E402,F401
-from boxctl.cli.commands import mcp  # noqa: E402,F401
-from boxctl.cli.commands import network  # noqa: E402,F401
-from boxctl.cli.commands import packages  # noqa: E402,F401
-from boxctl.cli.commands import ports  # noqa: E402,F401
-from boxctl.cli.commands import project  # noqa: E402,F401
-from boxctl.cli.commands import service  # noqa: E402,F401
-from boxctl.cli.commands import sessions  # noqa: E402,F401
-from boxctl.cli.commands import skill  # noqa: E402,F401
-from boxctl.cli.commands import worktree  # noqa: E402,F401
-from boxctl.cli.commands import workspace  # noqa: E402,F401
-from boxctl.cli.commands import quick  # noqa: E402,F401
-from boxctl.cli.commands import usage  # noqa: E402,F401
-from boxctl.cli.commands import logs  # noqa: E402,F401
-from boxctl.cli.commands import run  # noqa: E402,F401
-
-
-# Shortcut commands that delegate to command groups
-# These provide convenient top-level aliases for common operations
-
-
-@cli.command("start")
-def start_shortcut():
-    """Start container for current project (shortcut for: project start)."""
-    from boxctl.cli.commands.project import start
-
-    ctx = click.get_current_context()
-    ctx.invoke(start)
-
-
-@cli.command("stop")
-@click.argument("project_name", required=False, shell_complete=_complete_project_name)
-def stop_shortcut(project_name):
-    """Stop the project container (shortcut for: project stop)."""
-    from boxctl.cli.commands.project import stop
-
-    ctx = click.get_current_context()
-    ctx.invoke(stop, project_name=project_name)
-
-
-@cli.command("list")
-@click.argument("show_all", required=False)
-def list_shortcut(show_all):
-    """List all boxctl containers (shortcut for: project list)."""
-    from boxctl.cli.commands.project import list as project_list
-
-    ctx = click.get_current_context()
-    ctx.invoke(project_list, show_all=show_all)
-
-
-@cli.command("ps")
-@click.argument("show_all", required=False)
-def ps_shortcut(show_all):
-    """List all boxctl containers (alias for: list)."""
-    from boxctl.cli.commands.project import list as project_list
-
-    ctx = click.get_current_context()
-    ctx.invoke(project_list, show_all=show_all)
-
-
-@cli.command("shell")
-@click.argument("project_name", required=False, shell_complete=_complete_project_name)
-def shell_shortcut(project_name):
-    """Open interactive shell in container (shortcut for: project shell)."""
-    from boxctl.cli.commands.project import shell
-
-    ctx = click.get_current_context()
-    ctx.invoke(shell, project_name=project_name)
-
-
-@cli.command("connect")
-@click.argument("project_name", required=False, shell_complete=_complete_project_name)
-@click.argument("session", required=False, shell_complete=_complete_connect_session)
-def connect_shortcut(project_name, session):
-    """Connect to container (shortcut for: project connect)."""
-    from boxctl.cli.commands.project import connect
-
-    ctx = click.get_current_context()
-    ctx.invoke(connect, project_name=project_name, session=session)
-
-
-@cli.command("info")
-@click.argument("project_name", required=False, shell_complete=_complete_project_name)
-def info_shortcut(project_name):
-    """Show container info (shortcut for: project info)."""
-    from boxctl.cli.commands.project import info
-
-    ctx = click.get_current_context()
-    ctx.invoke(info, project_name=project_name)
-
-
-@cli.command("remove")
-@click.argument("project_name", required=False, shell_complete=_complete_project_name)
-@click.argument("force_remove", required=False)
-def remove_shortcut(project_name, force_remove):
-    """Remove the project container (shortcut for: project remove)."""
-    from boxctl.cli.commands.project import remove
-
-    ctx = click.get_current_context()
-    ctx.invoke(remove, project_name=project_name, force_remove=force_remove)
-
-
-@cli.command("cleanup")
-def cleanup_shortcut():
-    """Remove all stopped containers (shortcut for: project cleanup)."""
-    from boxctl.cli.commands.project import cleanup
-
-    ctx = click.get_current_context()
-    ctx.invoke(cleanup)
-
-
-@cli.command("rebase")
-@click.argument("scope", required=False)
-def rebase_shortcut(scope: str):
-    """Rebase project container to current base (shortcut for: project rebase).
-
-    Pass 'all' as argument to rebase all existing containers.
-    """
-    from boxctl.cli.commands.project import rebase
-
-    ctx = click.get_current_context()
-    ctx.invoke(rebase, scope=scope)
-
-
-@cli.command("init")
-def init_shortcut():
-    """Initialize .boxctl/ directory (shortcut for: project init)."""
-    from boxctl.cli.commands.project import init
-
-    ctx = click.get_current_context()
-    ctx.invoke(init)
-
-
-@cli.command("setup")
-def setup_shortcut():
-    """Initialize and configure boxctl (shortcut for: project setup)."""
-    from boxctl.cli.commands.project import setup
-
-    ctx = click.get_current_context()
-    ctx.invoke(setup)
-
-
-@cli.command("reconfigure")
-def reconfigure_shortcut():
-    """Reconfigure agent and project settings (shortcut for: project reconfigure)."""
-    from boxctl.cli.commands.project import reconfigure
-
-    ctx = click.get_current_context()
-    ctx.invoke(reconfigure)
-
-
-@cli.command("rebuild")
-def rebuild_shortcut():
-    """Rebuild base Docker image (shortcut for: base rebuild)."""
-    from boxctl.cli.commands.base import rebuild
-
-    ctx = click.get_current_context()
-    ctx.invoke(rebuild)
-
-
 @cli.command("fix-terminal")
 def fix_terminal():
     """Reset terminal to fix mouse mode and other escape sequence issues.
@@ -310,40 +225,13 @@ def fix_terminal():
 
     This disables mouse tracking mode and resets terminal settings.
     """
+    from boxctl.cli.helpers import console
     from boxctl.utils.terminal import reset_terminal
 
     reset_terminal()
     console.print("[green]Terminal reset complete[/green]")
 
 
-# Register plural aliases for skill and mcp groups
-from boxctl.cli.commands.skill import skill as skill_group
-from boxctl.cli.commands.mcp import mcp as mcp_group
-from boxctl.cli.commands.logs import logs as logs_group
-
-cli.add_command(skill_group, name="skills")
-cli.add_command(mcp_group, name="mcps")
-cli.add_command(logs_group)
-
-
-# Config command group for migration and config utilities
-@cli.group()
-def config():
-    """Configuration utilities (migrate)."""
-    pass
-
-
-@config.command("migrate")
-@click.option("--dry-run", is_flag=True, help="Show what would be migrated")
-@click.option("--auto", is_flag=True, help="Apply all without prompting")
-def config_migrate_shortcut(dry_run: bool, auto: bool):
-    """Migrate config to latest format (shortcut for: project migrate)."""
-    from boxctl.cli.commands.project import config_migrate
-
-    ctx = click.get_current_context()
-    ctx.invoke(config_migrate, dry_run=dry_run, auto=auto)
-
-
 @cli.command("migrate")
 @click.option("--dry-run", is_flag=True, help="Show what would be migrated without applying")
 @click.option("--remove-containers", is_flag=True, help="Remove legacy agentbox-* containers")
@@ -379,6 +267,7 @@ def migrate_command(
 
     Note: Project-level .agentbox directories are auto-migrated on first use.
     """
+    from boxctl.cli.helpers import console
     from boxctl.migrations.rename_migration import (
         check_legacy_config_file,
         check_legacy_global_config,
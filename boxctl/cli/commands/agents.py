@@ -10,7 +10,6 @@ from typing import Optional
 
 import click
 
-from boxctl.cli import cli
 from boxctl.container import ContainerManager
 from boxctl.cli.helpers import (
     _build_dynamic_context,
@@ -108,7 +107,7 @@ def _read_super_prompt() -> str:
     return f"{base_instructions}\n\n{super_instructions}\n\n{dynamic_context}"
 
 
-@cli.command()
+@click.command()
 @click.argument("prompt", nargs=-1)
 @click.pass_context
 @handle_errors
@@ -127,7 +126,7 @@ def claude(ctx, prompt: tuple):
     # Check for rate limit fallback
     fallback = _check_fallback("claude")
     if fallback:
-        fallback_cmd = cli.get_command(ctx, fallback)
+        fallback_cmd = ctx.find_root().command.get_command(ctx, fallback)
         if fallback_cmd:
             ctx.invoke(fallback_cmd, prompt=prompt)
             return
@@ -158,7 +157,7 @@ def claude(ctx, prompt: tuple):
     )
 
 
-@cli.command()
+@click.command()
 @click.argument("prompt", nargs=-1)
 @click.pass_context
 @handle_errors
@@ -177,7 +176,7 @@ def superclaude(ctx, prompt: tuple):
     # Check for rate limit fallback
     fallback = _check_fallback("superclaude")
     if fallback:
-        fallback_cmd = cli.get_command(ctx, fallback)
+        fallback_cmd = ctx.find_root().command.get_command(ctx, fallback)
         if fallback_cmd:
             ctx.invoke(fallback_cmd, prompt=prompt)
             return
@@ -210,7 +209,7 @@ def superclaude(ctx, prompt: tuple):
     )
 
 
-@cli.command()
+@click.command()
 @click.argument("prompt", nargs=-1)
 @click.pass_context
 @handle_errors
@@ -229,7 +228,7 @@ def codex(ctx, prompt: tuple):
     # Check for rate limit fallback
     fallback = _check_fallback("codex")
     if fallback:
-        fallback_cmd = cli.get_command(ctx, fallback)
+        fallback_cmd = ctx.find_root().command.get_command(ctx, fallback)
         if fallback_cmd:
             ctx.invoke(fallback_cmd, prompt=prompt)
             return
@@ -247,7 +246,7 @@ def codex(ctx, prompt: tuple):
     )
 
 
-@cli.command()
+@click.command()
 @click.argument("prompt", nargs=-1)
 @click.pass_context
 @handle_errors
@@ -266,7 +265,7 @@ def supercodex(ctx, prompt: tuple):
     # Check for rate limit fallback
     fallback = _check_fallback("supercodex")
     if fallback:
-        fallback_cmd = cli.get_command(ctx, fallback)
+        fallback_cmd = ctx.find_root().command.get_command(ctx, fallback)
         if fallback_cmd:
             ctx.invoke(fallback_cmd, prompt=prompt)
             return
@@ -290,7 +289,7 @@ def supercodex(ctx, prompt: tuple):
     )
 
 
-@cli.command()
+@click.command()
 @click.argument("prompt", nargs=-1)
 @click.pass_context
 @handle_errors
@@ -309,7 +308,7 @@ def gemini(ctx, prompt: tuple):
     # Check for rate limit fallback
     fallback = _check_fallback("gemini")
     if fallback:
-        fallback_cmd = cli.get_command(ctx, fallback)
+        fallback_cmd = ctx.find_root().command.get_command(ctx, fallback)
         if fallback_cmd:
             ctx.invoke(fallback_cmd, prompt=prompt)
             return
@@ -327,7 +326,7 @@ def gemini(ctx, prompt: tuple):
     )
 
 
-@cli.command()
+@click.command()
 @click.argument("prompt", nargs=-1)
 @click.pass_context
 @handle_errors
@@ -346,7 +345,7 @@ def supergemini(ctx, prompt: tuple):
     # Check for rate limit fallback
     fallback = _check_fallback("supergemini")
     if fallback:
-        fallback_cmd = cli.get_command(ctx, fallback)
+        fallback_cmd = ctx.find_root().command.get_command(ctx, fallback)
         if fallback_cmd:
             ctx.invoke(fallback_cmd, prompt=prompt)
             return
@@ -368,7 +367,7 @@ def supergemini(ctx, prompt: tuple):
     )
 
 
-@cli.command()
+@click.command()
 @click.argument("prompt", nargs=-1)
 @click.pass_context
 @handle_errors
@@ -387,7 +386,7 @@ def qwen(ctx, prompt: tuple):
     # Check for rate limit fallback
     fallback = _check_fallback("qwen")
     if fallback:
-        fallback_cmd = cli.get_command(ctx, fallback)
+        fallback_cmd = ctx.find_root().command.get_command(ctx, fallback)
         if fallback_cmd:
             ctx.invoke(fallback_cmd, prompt=prompt)
             return
@@ -405,7 +404,7 @@ def qwen(ctx, prompt: tuple):
     )
 
 
-@cli.command()
+@click.command()
 @click.argument("prompt", nargs=-1)
 @click.pass_context
 @handle_errors
@@ -424,7 +423,7 @@ def superqwen(ctx, prompt: tuple):
     # Check for rate limit fallback
     fallback = _check_fallback("superqwen")
     if fallback:
-        fallback_cmd = cli.get_command(ctx, fallback)
+        fallback_cmd = ctx.find_root().command.get_command(ctx, fallback)
         if fallback_cmd:
             ctx.invoke(fallback_cmd, prompt=prompt)
             return
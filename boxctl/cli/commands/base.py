@@ -13,11 +13,10 @@ import click
 
 from boxctl import __version__ as BOXCTL_VERSION
 from boxctl.container import ContainerManager
-from boxctl.cli import cli
 from boxctl.cli.helpers import console, handle_errors
 
 
-@cli.group()
+@click.group()
 def base():
     """Manage the boxctl base Docker image."""
     pass
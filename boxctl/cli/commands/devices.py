@@ -11,10 +11,10 @@ from typing import List, Set, Tuple
 import click
 import questionary
 
-from boxctl.cli import cli
 from boxctl.cli.helpers import (
     _get_project_context,
     _rebuild_container,
+    _require_project_config,
     _warn_if_agents_running,
     console,
     handle_errors,
@@ -70,7 +70,7 @@ def _save_devices(config: ProjectConfig, devices: List[str]) -> None:
     config.save()
 
 
-@cli.group(invoke_without_command=True)
+@click.group(invoke_without_command=True)
 @click.pass_context
 @handle_errors
 def devices(ctx):
@@ -96,10 +96,7 @@ def devices_choose():
     project_dir = resolve_project_dir()
     config = ProjectConfig(project_dir)
 
-    if not config.exists():
-        raise click.ClickException(
-            f"No .boxctl/config.yml found in {project_dir}. Run: boxctl init"
-        )
+    _require_project_config(config, project_dir)
 
     # Get available and configured devices
     available = _get_available_devices()
@@ -203,10 +200,7 @@ def devices_list():
     project_dir = resolve_project_dir()
     config = ProjectConfig(project_dir)
 
-    if not config.exists():
-        raise click.ClickException(
-            f"No .boxctl/config.yml found in {project_dir}. Run: boxctl init"
-        )
+    _require_project_config(config, project_dir)
 
     configured = _get_configured_devices(config)
     available = _get_available_devices()
@@ -252,10 +246,7 @@ def devices_add(device: str):
     project_dir = resolve_project_dir()
     config = ProjectConfig(project_dir)
 
-    if not config.exists():
-        raise click.ClickException(
-            f"No .boxctl/config.yml found in {project_dir}. Run: boxctl init"
-        )
+    _require_project_config(config, project_dir)
 
     # Validate device path format
     if not device.startswith("/dev/"):
@@ -299,10 +290,7 @@ def devices_remove(device: str):
     project_dir = resolve_project_dir()
     config = ProjectConfig(project_dir)
 
-    if not config.exists():
-        raise click.ClickException(
-            f"No .boxctl/config.yml found in {project_dir}. Run: boxctl init"
-        )
+    _require_project_config(config, project_dir)
 
     configured = _get_configured_devices(config)
 
@@ -333,10 +321,7 @@ def devices_clear():
     project_dir = resolve_project_dir()
     config = ProjectConfig(project_dir)
 
-    if not config.exists():
-        raise click.ClickException(
-            f"No .boxctl/config.yml found in {project_dir}. Run: boxctl init"
-        )
+    _require_project_config(config, project_dir)
 
     configured = _get_configured_devices(config)
 
@@ -4,19 +4,46 @@
 
 """Docker socket management commands."""
 
+import functools
 from pathlib import Path
 
 import click
 
-from boxctl.cli import cli
-from boxctl.cli.helpers import console, handle_errors
+from boxctl.cli.helpers import _require_project_config, console, handle_errors
 from boxctl.config import ProjectConfig
+from boxctl.paths import HostPaths
 from boxctl.utils.project import resolve_project_dir
 
-DOCKER_SOCKET = "/var/run/docker.sock"
+DOCKER_SOCKET = HostPaths.DOCKER_SOCKET
 
 
-@cli.group()
+@functools.lru_cache(maxsize=1)
+def _docker_socket_exists() -> bool:
+    """Check once per process whether the Docker socket exists on the host."""
+    return Path(DOCKER_SOCKET).exists()
+
+
+def _load_project_config() -> ProjectConfig:
+    """Return the project config, parsed once per CLI invocation.
+
+    The config is kept on the root click context so that commands run in the
+    same invocation share it.
+
+    Raises:
+        click.ClickException: If the project has no config file
+    """
+    project_dir = resolve_project_dir()
+    cache = click.get_current_context().find_root().ensure_object(dict)
+    key = ("project_config", project_dir)
+    config = cache.get(key)
+    if config is None:
+        config = ProjectConfig(project_dir)
+        _require_project_config(config, project_dir)
+        cache[key] = config
+    return config
+
+
+@click.group()
 def docker():
     """Manage Docker socket access for containers."""
     pass
@@ -30,16 +57,10 @@ def docker_enable():
     Mounts /var/run/docker.sock into the container, allowing
     agents to run docker commands. Requires container restart.
     """
-    project_dir = resolve_project_dir()
-    config = ProjectConfig(project_dir)
-
-    if not config.exists():
-        raise click.ClickException(
-            f"No .boxctl/config.yml found in {project_dir}. Run: boxctl init"
-        )
+    config = _load_project_config()
 
     # Check if docker socket exists on host
-    if not Path(DOCKER_SOCKET).exists():
+    if not _docker_socket_exists():
         console.print(f"[yellow]Warning: {DOCKER_SOCKET} not found on host[/yellow]")
         console.print("[dim]Docker daemon may not be running[/dim]")
 
@@ -61,13 +82,7 @@ def docker_disable():
 
     Removes the docker socket mount. Requires container restart.
     """
-    project_dir = resolve_project_dir()
-    config = ProjectConfig(project_dir)
-
-    if not config.exists():
-        raise click.ClickException(
-            f"No .boxctl/config.yml found in {project_dir}. Run: boxctl init"
-        )
+    config = _load_project_config()
 
     if not config.docker_enabled:
         console.print("[blue]Docker socket already disabled[/blue]")
@@ -83,30 +98,25 @@ def docker_disable():
 @handle_errors
 def docker_status():
     """Show Docker socket access status."""
-    project_dir = resolve_project_dir()
-    config = ProjectConfig(project_dir)
-
-    if not config.exists():
-        raise click.ClickException(
-            f"No .boxctl/config.yml found in {project_dir}. Run: boxctl init"
-        )
+    config = _load_project_config()
 
     enabled = config.docker_enabled
-    socket_exists = Path(DOCKER_SOCKET).exists()
+    socket_exists = _docker_socket_exists()
 
-    console.print("[bold]Docker Socket Status[/bold]")
-    console.print("")
+    lines = ["[bold]Docker Socket Status[/bold]", ""]
 
     if enabled:
-        console.print("[green]Config:[/green] Enabled (socket mounted as volume)")
+        lines.append("[green]Config:[/green] Enabled (socket mounted as volume)")
     else:
-        console.print("[yellow]Config:[/yellow] Disabled")
+        lines.append("[yellow]Config:[/yellow] Disabled")
 
     if socket_exists:
-        console.print(f"[green]Host:[/green] {DOCKER_SOCKET} exists")
+        lines.append(f"[green]Host:[/green] {DOCKER_SOCKET} exists")
     else:
-        console.print(f"[red]Host:[/red] {DOCKER_SOCKET} not found")
+        lines.append(f"[red]Host:[/red] {DOCKER_SOCKET} not found")
 
     if enabled and not socket_exists:
-        console.print("\n[yellow]Warning: Docker enabled but socket not found on host[/yellow]")
-        console.print("[dim]Is Docker daemon running?[/dim]")
+        lines.append("\n[yellow]Warning: Docker enabled but socket not found on host[/yellow]")
+        lines.append("[dim]Is Docker daemon running?[/dim]")
+
+    console.print("\n".join(lines))
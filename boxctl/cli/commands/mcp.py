@@ -4,14 +4,15 @@
 
 """MCP server commands."""
 
+import copy
+import functools
 import json
 from pathlib import Path
-from typing import Set
+from typing import Optional, Set
 
 import click
 import questionary
 
-from boxctl.cli import cli
 from boxctl.cli.helpers import (
     _complete_mcp_names,
     _copy_commands,
@@ -27,6 +28,7 @@ from boxctl.cli.helpers import (
     parse_env_file,
 )
 from boxctl.library import LibraryManager
+from boxctl.utils.config_io import atomic_write_bytes
 from boxctl.utils.logging import get_logger
 from boxctl.utils.project import resolve_project_dir, get_boxctl_dir
 
@@ -38,37 +40,65 @@ def _get_unified_mcp_path(boxctl_dir: Path) -> Path:
     return boxctl_dir / "mcp.json"
 
 
+@functools.lru_cache(maxsize=64)
+def _read_mcp_template(template_path: str, mtime_ns: int) -> dict:
+    """Parse an MCP config.json; cached per (path, mtime) so edits are picked up."""
+    return json.loads(Path(template_path).read_bytes())
+
+
+def _load_mcp_template(mcp_path: Path) -> Optional[dict]:
+    """Load an MCP's config.json template, or None if it has none.
+
+    Returns a fresh copy so callers may mutate it without touching the cache.
+    """
+    template_path = mcp_path / "config.json"
+    try:
+        mtime_ns = template_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return copy.deepcopy(_read_mcp_template(str(template_path), mtime_ns))
+
+
 def _get_installed_mcps(pctx) -> Set[str]:
     """Get set of currently installed MCP server names from unified config."""
-    installed = set()
-
-    # Read from unified mcp.json
+    # Read from unified mcp.json; a missing file is just an OSError here
     mcp_path = _get_unified_mcp_path(pctx.boxctl_dir)
-    if mcp_path.exists():
-        try:
-            mcp_data = json.loads(mcp_path.read_text())
-            installed.update(mcp_data.get("mcpServers", {}).keys())
-        except (json.JSONDecodeError, OSError):
-            pass
+    try:
+        mcp_data = json.loads(mcp_path.read_bytes())
+    except (json.JSONDecodeError, OSError):
+        return set()
 
-    return installed
+    return set(mcp_data.get("mcpServers") or ())
 
 
-def _add_mcp(name: str, lib_manager: LibraryManager, pctx) -> tuple[bool, bool]:
+def _add_mcp(
+    name: str,
+    lib_manager: LibraryManager,
+    pctx,
+    mcp_path: Optional[Path] = None,
+    template: Optional[dict] = None,
+    meta: Optional[dict] = None,
+) -> tuple[bool, bool]:
     """Add an MCP server to the project.
 
+    Callers that already resolved the MCP directory and loaded its
+    config.json can pass them in to skip the lookup. When ``meta`` is
+    given, the server entry is recorded there and saving it is left to
+    the caller.
+
     Returns:
         Tuple of (success, needs_rebuild)
     """
-    mcp_path = lib_manager.get_mcp_path(name)
     if mcp_path is None:
-        return False, False
+        mcp_path = lib_manager.get_mcp_path(name)
+        if mcp_path is None:
+            return False, False
 
-    template_path = mcp_path / "config.json"
-    if not template_path.exists():
-        return False, False
+    if template is None:
+        template = _load_mcp_template(mcp_path)
+        if template is None:
+            return False, False
 
-    template = json.loads(template_path.read_text())
     mcp_config = template["config"]
 
     # Load MCP-level .env file if it exists
@@ -90,7 +120,7 @@ def _add_mcp(name: str, lib_manager: LibraryManager, pctx) -> tuple[bool, bool]:
     unified_mcp_path.parent.mkdir(parents=True, exist_ok=True)
 
     if unified_mcp_path.exists():
-        mcp_data = json.loads(unified_mcp_path.read_text())
+        mcp_data = json.loads(unified_mcp_path.read_bytes())
     else:
         mcp_data = {"mcpServers": {}}
 
@@ -98,10 +128,12 @@ def _add_mcp(name: str, lib_manager: LibraryManager, pctx) -> tuple[bool, bool]:
         return False, False  # Already exists
 
     mcp_data["mcpServers"][name] = mcp_config
-    unified_mcp_path.write_text(json.dumps(mcp_data, indent=2) + "\n")
+    atomic_write_bytes(unified_mcp_path, (json.dumps(mcp_data, indent=2) + "\n").encode())
 
     # Store MCP metadata (including config for generate-mcp-config.py)
-    meta = _load_mcp_meta(pctx.boxctl_dir)
+    save_meta = meta is None
+    if save_meta:
+        meta = _load_mcp_meta(pctx.boxctl_dir)
 
     # Determine source type and name for smart path resolution at runtime
     source_type = lib_manager.get_mcp_source_type(mcp_path)
@@ -116,23 +148,27 @@ def _add_mcp(name: str, lib_manager: LibraryManager, pctx) -> tuple[bool, bool]:
         server_meta["install"] = template["install"]
     if "mounts" in template:
         server_meta["mounts"] = template["mounts"]
-    # Always save - every MCP needs an entry for config generation
-    meta["servers"][name] = server_meta
-    _save_mcp_meta(pctx.boxctl_dir, meta)
 
     # Copy slash commands if the MCP has any (mcp_path is library path)
     copied_commands = _copy_commands(mcp_path, pctx.project_dir, "mcp", name)
     if copied_commands:
-        meta["servers"][name]["commands"] = copied_commands
+        server_meta["commands"] = copied_commands
+
+    # Always save - every MCP needs an entry for config generation
+    meta["servers"][name] = server_meta
+    if save_meta:
         _save_mcp_meta(pctx.boxctl_dir, meta)
 
     needs_rebuild = "mounts" in template or "install" in template
     return True, needs_rebuild
 
 
-def _remove_mcp(name: str, pctx) -> tuple[bool, bool]:
+def _remove_mcp(name: str, pctx, meta: Optional[dict] = None) -> tuple[bool, bool]:
     """Remove an MCP server from the project.
 
+    When ``meta`` is given, the server entry is dropped from it and saving
+    it is left to the caller.
+
     Returns:
         Tuple of (removed, had_mounts)
     """
@@ -140,7 +176,9 @@ def _remove_mcp(name: str, pctx) -> tuple[bool, bool]:
     had_mounts = False
 
     # Check if MCP had mounts before removing
-    meta = _load_mcp_meta(pctx.boxctl_dir)
+    save_meta = meta is None
+    if save_meta:
+        meta = _load_mcp_meta(pctx.boxctl_dir)
     if name in meta.get("servers", {}):
         had_mounts = "mounts" in meta["servers"][name]
 
@@ -150,21 +188,22 @@ def _remove_mcp(name: str, pctx) -> tuple[bool, bool]:
     # Remove from unified mcp.json
     unified_mcp_path = _get_unified_mcp_path(pctx.boxctl_dir)
     if unified_mcp_path.exists():
-        mcp_data = json.loads(unified_mcp_path.read_text())
+        mcp_data = json.loads(unified_mcp_path.read_bytes())
         if name in mcp_data.get("mcpServers", {}):
             del mcp_data["mcpServers"][name]
-            unified_mcp_path.write_text(json.dumps(mcp_data, indent=2) + "\n")
+            atomic_write_bytes(unified_mcp_path, (json.dumps(mcp_data, indent=2) + "\n").encode())
             removed = True
 
     # Remove from MCP metadata only if we actually removed something
     if removed and name in meta.get("servers", {}):
         del meta["servers"][name]
-        _save_mcp_meta(pctx.boxctl_dir, meta)
+        if save_meta:
+            _save_mcp_meta(pctx.boxctl_dir, meta)
 
     return removed, had_mounts
 
 
-@cli.group(invoke_without_command=True)
+@click.group(invoke_without_command=True)
 @click.pass_context
 @handle_errors
 def mcp(ctx):
@@ -178,19 +217,24 @@ def mcp(ctx):
 @handle_errors
 def mcp_manage():
     """Interactive MCP server selection with checkboxes."""
+    from concurrent.futures import ThreadPoolExecutor
+
     pctx = _get_project_context()
     _require_boxctl_dir(pctx.boxctl_dir, pctx.project_dir)
 
     lib_manager = LibraryManager()
-    available_mcps = lib_manager.list_mcp_servers()
+    # Both are needed before the prompt can render: read the project's
+    # mcp.json in the background while scanning the library
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        installed_future = executor.submit(_get_installed_mcps, pctx)
+        available_mcps = lib_manager.list_mcp_servers()
+        installed = installed_future.result()
 
     if not available_mcps:
         console.print("[yellow]No MCP servers available in library[/yellow]")
         console.print(f"[blue]Add MCP servers to: {lib_manager.mcp_dir}[/blue]")
         return
 
-    installed = _get_installed_mcps(pctx)
-
     # Build choices with pre-selection
     choices = []
     for mcp_info in available_mcps:
@@ -236,36 +280,42 @@ def mcp_manage():
     removed = []
     env_templates = {}
     notes = []
+    # Shared across all adds and removes, saved once below
+    meta = _load_mcp_meta(pctx.boxctl_dir)
+
+    # The library scan already resolved each MCP's directory (custom over library)
+    mcp_paths = {mcp_info["name"]: Path(mcp_info["path"]) for mcp_info in available_mcps}
 
     # Add new MCPs
     for name in to_add:
-        success, rebuild_needed = _add_mcp(name, lib_manager, pctx)
+        mcp_path = mcp_paths.get(name)
+        template = _load_mcp_template(mcp_path) if mcp_path else None
+        success, rebuild_needed = _add_mcp(name, lib_manager, pctx, mcp_path, template, meta)
         if success:
             added.append(name)
             if rebuild_needed:
                 needs_rebuild = True
 
             # Collect env templates and notes
-            mcp_path = lib_manager.get_mcp_path(name)
-            if mcp_path:
-                template_path = mcp_path / "config.json"
-                if template_path.exists():
-                    template = json.loads(template_path.read_text())
-                    if "env_template" in template:
-                        env_templates[name] = template["env_template"]
-                    if "notes" in template:
-                        notes.append(f"{name}: {template['notes']}")
+            if template:
+                if "env_template" in template:
+                    env_templates[name] = template["env_template"]
+                if "notes" in template:
+                    notes.append(f"{name}: {template['notes']}")
         else:
             console.print(f"[red]Failed to add MCP server '{name}'[/red]")
 
     # Remove MCPs
     for name in to_remove:
-        success, had_mounts = _remove_mcp(name, pctx)
+        success, had_mounts = _remove_mcp(name, pctx, meta)
         if success:
             removed.append(name)
             if had_mounts:
                 needs_rebuild = True
 
+    if added or removed:
+        _save_mcp_meta(pctx.boxctl_dir, meta)
+
     # Print summary
     if added:
         console.print(f"[green]Added MCP servers: {', '.join(sorted(added))}[/green]")
@@ -325,7 +375,9 @@ def mcp_add(name: str):
     _require_boxctl_dir(pctx.boxctl_dir, pctx.project_dir)
 
     lib_manager = LibraryManager()
-    success, needs_rebuild = _add_mcp(name, lib_manager, pctx)
+    mcp_path = lib_manager.get_mcp_path(name)
+    template = _load_mcp_template(mcp_path) if mcp_path else None
+    success, needs_rebuild = _add_mcp(name, lib_manager, pctx, mcp_path, template)
 
     if not success:
         raise click.ClickException(f"MCP server '{name}' not found or already added")
@@ -333,18 +385,14 @@ def mcp_add(name: str):
     console.print(f"[green]✓ Added '{name}' to .boxctl/mcp.json[/green]")
 
     # Show env template if present
-    mcp_path = lib_manager.get_mcp_path(name)
-    if mcp_path:
-        template_path = mcp_path / "config.json"
-        if template_path.exists():
-            template = json.loads(template_path.read_text())
-            if "env_template" in template:
-                console.print("\n[yellow]Configure environment variables:[/yellow]")
-                for key, value in template["env_template"].items():
-                    console.print(f"  {key}={value}")
-                console.print("\n[blue]Add to .boxctl/.env or set in your shell[/blue]")
-            if "notes" in template:
-                console.print(f"\n[blue]Note: {template['notes']}[/blue]")
+    if template:
+        if "env_template" in template:
+            console.print("\n[yellow]Configure environment variables:[/yellow]")
+            for key, value in template["env_template"].items():
+                console.print(f"  {key}={value}")
+            console.print("\n[blue]Add to .boxctl/.env or set in your shell[/blue]")
+        if "notes" in template:
+            console.print(f"\n[blue]Note: {template['notes']}[/blue]")
 
     # Rebuild container if needed
     if needs_rebuild:
@@ -10,7 +10,6 @@ from typing import Optional
 import click
 from rich.table import Table
 
-from boxctl.cli import cli
 from boxctl.container import ContainerManager
 from boxctl.cli.helpers import (
     _get_project_context,
@@ -26,7 +25,7 @@ from boxctl.cli.helpers.completions import (
 from boxctl.utils.project import resolve_project_dir, get_boxctl_dir
 
 
-@cli.group()
+@click.group()
 def network():
     """Connect to other Docker containers."""
     pass
@@ -9,9 +9,7 @@ from pathlib import Path
 import click
 from rich.table import Table
 
-import boxctl.cli as cli_module
 from boxctl.config import ProjectConfig
-from boxctl.cli import cli
 from boxctl.cli.helpers import (
     _get_project_context,
     _load_packages_config,
@@ -25,7 +23,7 @@ from boxctl.cli.helpers import (
 from boxctl.utils.project import resolve_project_dir, get_boxctl_dir
 
 
-@cli.group(name="packages")
+@click.group(name="packages")
 def packages_group():
     """Manage project package installations."""
     pass
@@ -41,9 +39,12 @@ def packages_list():
 
     packages = _load_packages_config(boxctl_dir)
 
-    has_packages = any(packages[key] for key in ["npm", "pip", "apt", "cargo", "post"])
+    rows = [
+        (key, ", ".join(packages[key])) for key in ("npm", "pip", "apt", "cargo") if packages[key]
+    ]
+    post = packages["post"]
 
-    if not has_packages:
+    if not rows and not post:
         console.print("[yellow]No packages configured[/yellow]")
         console.print("\n[blue]Add packages with:[/blue]")
         console.print("  boxctl packages add npm <package>")
@@ -56,17 +57,10 @@ def packages_list():
     table.add_column("Type", style="cyan")
     table.add_column("Packages", style="white")
 
-    if packages["npm"]:
-        table.add_row("npm", ", ".join(packages["npm"]))
-    if packages["pip"]:
-        table.add_row("pip", ", ".join(packages["pip"]))
-    if packages["apt"]:
-        table.add_row("apt", ", ".join(packages["apt"]))
-    if packages["cargo"]:
-        table.add_row("cargo", ", ".join(packages["cargo"]))
-    if packages["post"]:
-        for i, cmd in enumerate(packages["post"], 1):
-            table.add_row(f"post-{i}", cmd)
+    for package_type, names in rows:
+        table.add_row(package_type, names)
+    for i, cmd in enumerate(post, 1):
+        table.add_row(f"post-{i}", cmd)
 
     console.print(table)
     console.print("\n[dim]Packages are installed when you add them or run 'boxctl rebase'[/dim]")
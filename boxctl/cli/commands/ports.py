@@ -4,55 +4,65 @@
 
 """Port forwarding commands."""
 
-import os
-import socket
+import contextlib
+import functools
 from pathlib import Path
 
 import click
 
-from boxctl.cli import cli
-from boxctl.cli.helpers import _get_project_context, console, handle_errors
-from boxctl.config import parse_port_spec, validate_host_port, ProjectConfig
+from boxctl.cli.helpers import (
+    ErrorCode,
+    _get_project_context,
+    console,
+    handle_errors,
+    send_boxctld_command,
+)
+from boxctl.config import validate_host_port, ProjectConfig
 from boxctl.paths import ContainerDefaults
 from boxctl.utils.project import resolve_project_dir
 
 
-def _get_boxctld_socket_path() -> Path:
-    """Get the boxctld socket path (platform-aware: macOS vs Linux)."""
-    from boxctl.host_config import get_config
-
-    return get_config().socket_path
-
-
 def _send_boxctld_command(command: dict) -> dict:
     """Send a command to boxctld and get response."""
-    import json
-
-    socket_path = _get_boxctld_socket_path()
-    if not socket_path.exists():
+    response = send_boxctld_command(command)
+    if response.get("code") == ErrorCode.NOT_RUNNING:
         raise RuntimeError("boxctld not running. Start with: boxctl service start")
+    return response
 
-    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    try:
-        sock.connect(str(socket_path))
-        sock.settimeout(5.0)
-        sock.sendall((json.dumps(command) + "\n").encode())
-
-        # Read response
-        data = b""
-        while b"\n" not in data:
-            chunk = sock.recv(4096)
-            if not chunk:
-                break
-            data += chunk
-
-        if data:
-            return json.loads(data.decode().strip())
-        return {"ok": False, "error": "No response from boxctld"}
-    except Exception as e:
-        return {"ok": False, "error": str(e)}
-    finally:
-        sock.close()
+
+@functools.lru_cache(maxsize=256)
+def _parse_simple_spec(spec: str) -> tuple[int, int]:
+    """Parse a "port" or "a:b" spec into (a, b); a bare port maps to itself.
+
+    Raises:
+        ValueError: If the spec is not one or two integers
+    """
+    head, sep, tail = spec.partition(":")
+    if not sep:
+        port = int(head)
+        return port, port
+    if ":" in tail:
+        raise ValueError(f"Invalid port format: {spec}")
+    return int(head), int(tail)
+
+
+def _forwarded_ports(entry) -> tuple[int, int]:
+    """Get (host_port, container_port) of a forwarded entry (dict or string format)."""
+    if isinstance(entry, dict):
+        host_port = entry.get("port", 0)
+        return host_port, entry.get("container_port", host_port)
+    return _parse_simple_spec(str(entry))
+
+
+@contextlib.contextmanager
+def _mutate_ports(config: ProjectConfig):
+    """Yield a project's port config for editing; save it once if it changed."""
+    ports = config.ports
+    raw_ports = {**ports, "host": list(ports["host"]), "container": list(ports["container"])}
+    yield raw_ports
+    if raw_ports != ports:
+        config.ports = raw_ports
+        config.save()
 
 
 def _get_container_name() -> str:
@@ -68,7 +78,7 @@ def _get_active_ports() -> dict:
         dicts with 'host_port', 'container_port', and 'container' keys.
         Returns empty lists if daemon is not running.
     """
-    response = _send_boxctld_command({"action": "get_active_ports"})
+    response = send_boxctld_command({"action": "get_active_ports"})
     if response.get("ok"):
         return {
             "host_ports": response.get("host_ports", []),
@@ -77,7 +87,7 @@ def _get_active_ports() -> dict:
     return {"host_ports": [], "container_ports": []}
 
 
-@cli.group()
+@click.group()
 def ports():
     """Manage port forwarding (list, add, remove).
 
@@ -144,49 +154,44 @@ def _list_current_project_ports():
     cm = ContainerManager()
     is_running = cm.is_running(container_name)
 
-    console.print("[bold]Port Configuration[/bold]")
+    # Collect the view and print it once, so Rich renders it in one pass
     status_text = "[green]running[/green]" if is_running else "[yellow]stopped[/yellow]"
-    console.print(f"Container: {container_name} ({status_text})\n")
-
-    # Legend
-    console.print("[dim]● = active (bound)  ○ = configured (not bound)[/dim]\n")
+    lines = [
+        "[bold]Port Configuration[/bold]",
+        f"Container: {container_name} ({status_text})",
+        "",
+        # Legend
+        "[dim]● = active (bound)  ○ = configured (not bound)[/dim]",
+        "",
+    ]
 
     # Exposed ports (container -> host)
-    console.print("[cyan]Exposed Ports[/cyan] (container → host)")
+    lines.append("[cyan]Exposed Ports[/cyan] (container → host)")
     if host_ports:
         for spec in host_ports:
-            parsed = parse_port_spec(spec)
-            hp, cp = parsed["host_port"], parsed["container_port"]
+            hp, cp = _parse_simple_spec(spec)
             is_active = (hp, cp) in active_exposed
             icon = "[green]●[/green]" if is_active else "[yellow]○[/yellow]"
-            console.print(f"  {icon} container:{cp} → host:{hp}")
+            lines.append(f"  {icon} container:{cp} → host:{hp}")
     else:
-        console.print("  [dim]No exposed ports[/dim]")
+        lines.append("  [dim]No exposed ports[/dim]")
 
-    console.print()
+    lines.append("")
 
     # Forwarded ports (host -> container)
-    console.print("[cyan]Forwarded Ports[/cyan] (host → container)")
+    lines.append("[cyan]Forwarded Ports[/cyan] (host → container)")
     if container_ports:
         for entry in container_ports:
-            # Handle both old dict format and new string format
-            if isinstance(entry, dict):
-                host_port = entry.get("port", 0)
-                container_port = entry.get("container_port", host_port)
-            else:
-                parts = str(entry).split(":")
-                if len(parts) == 2:
-                    host_port, container_port = int(parts[0]), int(parts[1])
-                else:
-                    host_port = container_port = int(parts[0])
+            host_port, container_port = _forwarded_ports(entry)
             is_active = (host_port, container_port) in active_forwarded
             icon = "[green]●[/green]" if is_active else "[yellow]○[/yellow]"
-            console.print(f"  {icon} host:{host_port} → container:{container_port}")
+            lines.append(f"  {icon} host:{host_port} → container:{container_port}")
     else:
-        console.print("  [dim]No forwarded ports[/dim]")
+        lines.append("  [dim]No forwarded ports[/dim]")
 
-    console.print()
-    console.print("[dim]Add ports: abox ports expose <port> or abox ports forward <port>[/dim]")
+    lines.append("")
+    lines.append("[dim]Add ports: abox ports expose <port> or abox ports forward <port>[/dim]")
+    console.print("\n".join(lines))
 
 
 def _list_all_containers_ports():
@@ -219,6 +224,9 @@ def _list_all_containers_ports():
 
     console.print("[bold]Port Configuration (All Containers)[/bold]\n")
 
+    # Containers can share a project, so parse each project's config once
+    configured_by_path = {}  # project_path -> (exposed, forwarded)
+
     found_any = False
     for container_info in sorted(containers, key=lambda x: x["project"]):
         project_name = container_info["project"]
@@ -234,24 +242,9 @@ def _list_all_containers_ports():
         config_exposed = []
         config_forwarded = []
         if project_path:
-            try:
-                config = ProjectConfig(Path(project_path))
-                for spec in config.ports_host:
-                    parsed = parse_port_spec(spec)
-                    config_exposed.append((parsed["host_port"], parsed["container_port"]))
-                for entry in config.ports_container:
-                    if isinstance(entry, dict):
-                        h = entry.get("port", 0)
-                        c = entry.get("container_port", h)
-                    else:
-                        parts = str(entry).split(":")
-                        if len(parts) == 2:
-                            h, c = int(parts[0]), int(parts[1])
-                        else:
-                            h = c = int(parts[0])
-                    config_forwarded.append((h, c))
-            except Exception:
-                pass
+            if project_path not in configured_by_path:
+                configured_by_path[project_path] = _load_configured_ports(Path(project_path))
+            config_exposed, config_forwarded = configured_by_path[project_path]
 
         # Get Docker port bindings
         docker_ports = _get_docker_port_bindings(container_name)
@@ -266,39 +259,61 @@ def _list_all_containers_ports():
             continue  # Skip containers with no ports
 
         found_any = True
-        console.print(
+        # One print per container: a block shows up as soon as its Docker lookup is done
+        lines = [
             f"[{status_color}]{status_icon}[/{status_color}] [bold cyan]{project_name}[/bold cyan] [dim]({status})[/dim]"
-        )
+        ]
 
         # Show Docker port bindings
         if docker_ports:
-            console.print("  [dim]Docker ports:[/dim]")
+            lines.append("  [dim]Docker ports:[/dim]")
             for host_port, container_port in sorted(docker_ports):
-                console.print(f"    [green]●[/green] container:{container_port} → host:{host_port}")
+                lines.append(f"    [green]●[/green] container:{container_port} → host:{host_port}")
 
         # Show configured exposed ports
         if config_exposed:
-            console.print("  [dim]Exposed (config):[/dim]")
+            lines.append("  [dim]Exposed (config):[/dim]")
             for host_port, container_port in sorted(config_exposed):
                 # Check if active
                 is_active = (host_port, container_port) in tunnel_exposed
                 icon = "[green]●[/green]" if is_active else "[yellow]○[/yellow]"
-                console.print(f"    {icon} container:{container_port} → host:{host_port}")
+                lines.append(f"    {icon} container:{container_port} → host:{host_port}")
 
         # Show configured forwarded ports
         if config_forwarded:
-            console.print("  [dim]Forwarded (config):[/dim]")
+            lines.append("  [dim]Forwarded (config):[/dim]")
             for host_port, container_port in sorted(config_forwarded):
                 is_active = (host_port, container_port) in tunnel_forwarded
                 icon = "[green]●[/green]" if is_active else "[yellow]○[/yellow]"
-                console.print(f"    {icon} host:{host_port} → container:{container_port}")
+                lines.append(f"    {icon} host:{host_port} → container:{container_port}")
 
-        console.print()
+        lines.append("")
+        console.print("\n".join(lines))
 
     if not found_any:
         console.print("[dim]No containers have ports configured[/dim]")
 
 
+def _load_configured_ports(project_dir: Path) -> tuple[list, list]:
+    """Get a project's configured exposed and forwarded ports.
+
+    Returns:
+        (exposed, forwarded) lists of (host_port, container_port) tuples.
+        Ports parsed before an unreadable config or invalid entry are kept.
+    """
+    exposed = []
+    forwarded = []
+    try:
+        config = ProjectConfig(project_dir)
+        for spec in config.ports_host:
+            exposed.append(_parse_simple_spec(spec))
+        for entry in config.ports_container:
+            forwarded.append(_forwarded_ports(entry))
+    except Exception:
+        pass
+    return exposed, forwarded
+
+
 def _get_docker_port_bindings(container_name: str) -> list:
     """Get Docker port bindings for a container.
 
@@ -341,13 +356,9 @@ def expose(port_spec: str):
     Note: Host ports below 1024 require root and are not allowed.
     """
     # Parse as container:host format
-    parts = port_spec.split(":")
-    if len(parts) == 1:
-        container_port = host_port = int(parts[0])
-    elif len(parts) == 2:
-        container_port = int(parts[0])
-        host_port = int(parts[1])
-    else:
+    try:
+        container_port, host_port = _parse_simple_spec(port_spec)
+    except ValueError:
         raise click.ClickException(
             f"Invalid port format: {port_spec}. Use 'port' or 'container:host'"
         )
@@ -362,57 +373,54 @@ def expose(port_spec: str):
     if not config.exists():
         raise click.ClickException("No .boxctl/config.yml found. Run: boxctl init")
 
-    # Check if already configured in this project
-    current_ports = config.ports_host
-    for existing in current_ports:
-        existing_parsed = parse_port_spec(existing)
-        if existing_parsed["host_port"] == host_port:
-            console.print(f"[yellow]Host port {host_port} already exposed[/yellow]")
-            return
-
-    # Check if port is in use by another boxctl container
-    container_name = _get_container_name()
-    active_ports = _get_active_ports()
-    for port_info in active_ports["host_ports"]:
-        if port_info["host_port"] == host_port and port_info["container"] != container_name:
-            other_project = port_info["container"].replace(
-                ContainerDefaults.CONTAINER_PREFIX, "", 1
-            )
-            console.print(
-                f"[red]Error: Host port {host_port} is already exposed by project '{other_project}'[/red]"
-            )
+    with _mutate_ports(config) as raw_ports:
+        # Check if already configured in this project
+        for existing in raw_ports["host"]:
+            if _parse_simple_spec(existing)[0] == host_port:
+                console.print(f"[yellow]Host port {host_port} already exposed[/yellow]")
+                return
+
+        # Check if port is in use by another boxctl container
+        container_name = _get_container_name()
+        active_ports = _get_active_ports()
+        for port_info in active_ports["host_ports"]:
+            if port_info["host_port"] == host_port and port_info["container"] != container_name:
+                other_project = port_info["container"].replace(
+                    ContainerDefaults.CONTAINER_PREFIX, "", 1
+                )
+                console.print(
+                    f"[red]Error: Host port {host_port} is already exposed by project '{other_project}'[/red]"
+                )
+                return
+
+        # Try to add to running proxy (dynamically, no rebuild needed). This goes
+        # first so a port the host can't bind never ends up in the config; if
+        # boxctld isn't running the port is still saved for the next start.
+        response = send_boxctld_command(
+            {
+                "action": "add_host_port",
+                "container": container_name,
+                "host_port": host_port,
+                "container_port": container_port,
+            }
+        )
+        if response.get("code") == ErrorCode.PORT_IN_USE:
+            console.print(f"[red]Error: Host port {host_port} is already in use[/red]")
+            console.print(f"[red]{response.get('error', '')}[/red]")
             return
 
-    # Update config - store in host:container format for backward compatibility
-    raw_ports = config.ports.copy()
-
-    if "host" not in raw_ports:
-        raw_ports["host"] = []
-
-    # Store as host:container format
-    if host_port == container_port:
-        storage_spec = str(host_port)
-    else:
-        storage_spec = f"{host_port}:{container_port}"
-    raw_ports["host"].append(storage_spec)
-    config.ports = raw_ports
-    config.save()
-
-    # Try to add to running proxy (dynamically, no rebuild needed)
-    response = _send_boxctld_command(
-        {
-            "action": "add_host_port",
-            "container": container_name,
-            "host_port": host_port,
-            "container_port": container_port,
-        }
-    )
+        # Update config - store in host:container format for backward compatibility
+        if host_port == container_port:
+            storage_spec = str(host_port)
+        else:
+            storage_spec = f"{host_port}:{container_port}"
+        raw_ports["host"].append(storage_spec)
 
     if response.get("ok"):
         console.print(f"[green]✓ Exposed container:{container_port} → host:{host_port}[/green]")
         if response.get("message"):
             console.print(f"[dim]{response.get('message')}[/dim]")
-    elif "No response" in response.get("error", "") or "not running" in response.get("error", ""):
+    elif response.get("code") in (ErrorCode.NO_RESPONSE, ErrorCode.NOT_RUNNING):
         console.print(
             "[yellow]Port saved to config. Start proxy with: boxctl service start[/yellow]"
         )
@@ -422,7 +430,7 @@ def expose(port_spec: str):
         console.print(f"[red]{error}[/red]")
 
         # Provide helpful guidance for Docker conflicts
-        if "Docker" in error or "in use" in error.lower():
+        if response.get("code") == ErrorCode.DOCKER_CONFLICT:
             console.print("\n[bold]To fix this:[/bold]")
             console.print("  1. Add 'mode: tunnel' under 'ports:' in .boxctl/config.yml")
             console.print("  2. Run: abox rebuild")
@@ -445,13 +453,9 @@ def forward(port_spec: str):
     Example: abox ports forward 9222
     """
     # Parse port spec
-    parts = port_spec.split(":")
-    if len(parts) == 1:
-        port = container_port = int(parts[0])
-    elif len(parts) == 2:
-        port = int(parts[0])
-        container_port = int(parts[1])
-    else:
+    try:
+        port, container_port = _parse_simple_spec(port_spec)
+    except ValueError:
         raise click.ClickException(
             f"Invalid port format: {port_spec}. Use 'port' or 'host:container'"
         )
@@ -463,55 +467,48 @@ def forward(port_spec: str):
     if not config.exists():
         raise click.ClickException("No .boxctl/config.yml found. Run: boxctl init")
 
-    # Check if already configured in this project
-    current_ports = config.ports_container
-    for entry in current_ports:
-        existing_port = (
-            entry.get("port") if isinstance(entry, dict) else int(str(entry).split(":")[0])
+    with _mutate_ports(config) as raw_ports:
+        # Check if already configured in this project
+        for entry in raw_ports["container"]:
+            if _forwarded_ports(entry)[0] == port:
+                console.print(f"[yellow]Port {port} already forwarded[/yellow]")
+                return
+
+        # Check if port is in use by another boxctl container
+        container_name = _get_container_name()
+        active_ports = _get_active_ports()
+        for port_info in active_ports["container_ports"]:
+            if port_info["host_port"] == port and port_info["container"] != container_name:
+                other_project = port_info["container"].replace(
+                    ContainerDefaults.CONTAINER_PREFIX, "", 1
+                )
+                console.print(
+                    f"[red]Error: Host port {port} is already forwarded by project '{other_project}'[/red]"
+                )
+                return
+
+        # Try to dynamically add the listener via proxy socket, before saving
+        response = send_boxctld_command(
+            {
+                "action": "add_container_port",
+                "container": container_name,
+                "host_port": port,
+                "container_port": container_port,
+            }
         )
-        if existing_port == port:
-            console.print(f"[yellow]Port {port} already forwarded[/yellow]")
-            return
-
-    # Check if port is in use by another boxctl container
-    container_name = _get_container_name()
-    active_ports = _get_active_ports()
-    for port_info in active_ports["container_ports"]:
-        if port_info["host_port"] == port and port_info["container"] != container_name:
-            other_project = port_info["container"].replace(
-                ContainerDefaults.CONTAINER_PREFIX, "", 1
-            )
-            console.print(
-                f"[red]Error: Host port {port} is already forwarded by project '{other_project}'[/red]"
-            )
+        if response.get("code") == ErrorCode.PORT_IN_USE:
+            console.print(f"[red]Error: Container port {container_port} is already in use[/red]")
+            console.print(f"[red]{response.get('error', '')}[/red]")
             return
 
-    # Update config - store as simple port spec string (like host ports)
-    raw_ports = config.ports.copy()
-
-    if "container" not in raw_ports:
-        raw_ports["container"] = []
-
-    # Store as "port" or "host:container" string
-    raw_ports["container"].append(port_spec)
-    config.ports = raw_ports
-    config.save()
+        # Update config - store as "port" or "host:container" string (like host ports)
+        raw_ports["container"].append(port_spec)
 
     console.print(f"[green]✓ Forwarding host:{port} → container:{container_port}[/green]")
 
-    # Try to dynamically add the listener via proxy socket
-    response = _send_boxctld_command(
-        {
-            "action": "add_container_port",
-            "container": container_name,
-            "host_port": port,
-            "container_port": container_port,
-        }
-    )
-
     if response.get("ok"):
         console.print(f"[green]✓ Listener active now on container:{container_port}[/green]")
-    elif "not connected" in response.get("error", ""):
+    elif response.get("code") == ErrorCode.NOT_CONNECTED:
         console.print(
             "[blue]Tunnel client not connected. Will be active when container starts.[/blue]"
         )
@@ -536,27 +533,14 @@ def unexpose(port: int):
         raise click.ClickException("No .boxctl/config.yml found")
 
     # Find and remove matching port spec
-    raw_ports = config.ports.copy()
+    with _mutate_ports(config) as raw_ports:
+        host_ports = raw_ports["host"]
+        raw_ports["host"] = [spec for spec in host_ports if _parse_simple_spec(spec)[0] != port]
 
-    host_ports = raw_ports.get("host", [])
-    found = False
-    new_host_ports = []
-
-    for spec in host_ports:
-        parsed = parse_port_spec(spec)
-        if parsed["host_port"] == port:
-            found = True
-        else:
-            new_host_ports.append(spec)
-
-    if not found:
+    if raw_ports["host"] == host_ports:
         console.print(f"[yellow]Port {port} not exposed[/yellow]")
         return
 
-    raw_ports["host"] = new_host_ports
-    config.ports = raw_ports
-    config.save()
-
     # Try to remove from running proxy
     container_name = _get_container_name()
     response = _send_boxctld_command(
@@ -570,13 +554,11 @@ def unexpose(port: int):
     if response.get("ok"):
         console.print(f"[green]✓ Unexposed port {port}[/green]")
         console.print(f"[green]✓ Listener stopped[/green]")
+    elif response.get("code") == ErrorCode.NOT_CONNECTED:
+        console.print(f"[green]✓ Unexposed port {port}[/green]")
+        console.print("[blue]Container not connected. Config updated.[/blue]")
     else:
-        error = response.get("error", "")
-        if "not connected" in error:
-            console.print(f"[green]✓ Unexposed port {port}[/green]")
-            console.print("[blue]Container not connected. Config updated.[/blue]")
-        else:
-            console.print(f"[green]✓ Unexposed port {port} (config updated)[/green]")
+        console.print(f"[green]✓ Unexposed port {port} (config updated)[/green]")
 
 
 @ports.command(name="unforward", options_metavar="")
@@ -594,32 +576,16 @@ def unforward(port: int):
         raise click.ClickException("No .boxctl/config.yml found")
 
     # Find and remove matching entry
-    raw_ports = config.ports.copy()
-
-    container_ports = raw_ports.get("container", [])
-    found = False
-    new_container_ports = []
-
-    for entry in container_ports:
-        # Handle both old dict format and new string format
-        if isinstance(entry, dict):
-            entry_port = entry.get("port", 0)
-        else:
-            entry_port = int(str(entry).split(":")[0])
+    with _mutate_ports(config) as raw_ports:
+        container_ports = raw_ports["container"]
+        raw_ports["container"] = [
+            entry for entry in container_ports if _forwarded_ports(entry)[0] != port
+        ]
 
-        if entry_port == port:
-            found = True
-        else:
-            new_container_ports.append(entry)
-
-    if not found:
+    if raw_ports["container"] == container_ports:
         console.print(f"[yellow]Port {port} not forwarded[/yellow]")
         return
 
-    raw_ports["container"] = new_container_ports
-    config.ports = raw_ports
-    config.save()
-
     console.print(f"[green]✓ Unforwarded port {port}[/green]")
 
     # Try to dynamically remove the listener via proxy socket
@@ -634,7 +600,7 @@ def unforward(port: int):
 
     if response.get("ok"):
         console.print(f"[green]✓ Listener stopped[/green]")
-    elif "not connected" in response.get("error", ""):
+    elif response.get("code") == ErrorCode.NOT_CONNECTED:
         console.print("[blue]Container not connected. Config updated.[/blue]")
     else:
         console.print("[yellow]Listener will stop on container restart.[/yellow]")
@@ -644,17 +610,16 @@ def unforward(port: int):
 @handle_errors
 def ports_status():
     """Show active port tunnels (runtime status)."""
-    # Get active ports from daemon
-    active_ports = _get_active_ports()
-
-    # Check if daemon is running
-    if not active_ports["host_ports"] and not active_ports["container_ports"]:
-        # Try to verify daemon is actually running
-        response = _send_boxctld_command({"action": "get_active_ports"})
-        if not response.get("ok"):
-            console.print("[yellow]Could not connect to boxctld. Is the service running?[/yellow]")
-            console.print("[dim]Start with: boxctl service start[/dim]")
-            return
+    # Get active ports from daemon; a failed request means it isn't reachable
+    response = _send_boxctld_command({"action": "get_active_ports"})
+    if not response.get("ok"):
+        console.print("[yellow]Could not connect to boxctld. Is the service running?[/yellow]")
+        console.print("[dim]Start with: boxctl service start[/dim]")
+        return
+    active_ports = {
+        "host_ports": response.get("host_ports", []),
+        "container_ports": response.get("container_ports", []),
+    }
 
     console.print("[bold]Active Port Tunnels[/bold]\n")
 
@@ -685,32 +650,34 @@ def ports_status():
         console.print("[dim]No active port tunnels[/dim]")
         return
 
-    # Show ports grouped by container
+    # Show ports grouped by container, printed in one go
+    lines = []
     for container in sorted(all_containers):
         project_name = ContainerDefaults.project_from_container(container)
-        console.print(f"[cyan]{project_name}[/cyan]")
+        lines.append(f"[cyan]{project_name}[/cyan]")
 
         exposed = exposed_by_container.get(container, [])
         forwarded = forwarded_by_container.get(container, [])
 
         if exposed:
-            console.print("  [dim]Exposed (container → host):[/dim]")
+            lines.append("  [dim]Exposed (container → host):[/dim]")
             for host_port, container_port in sorted(exposed):
                 if host_port == container_port:
-                    console.print(f"    [green]●[/green] :{host_port}")
+                    lines.append(f"    [green]●[/green] :{host_port}")
                 else:
-                    console.print(
+                    lines.append(
                         f"    [green]●[/green] container:{container_port} → host:{host_port}"
                     )
 
         if forwarded:
-            console.print("  [dim]Forwarded (host → container):[/dim]")
+            lines.append("  [dim]Forwarded (host → container):[/dim]")
             for host_port, container_port in sorted(forwarded):
                 if host_port == container_port:
-                    console.print(f"    [green]●[/green] :{host_port}")
+                    lines.append(f"    [green]●[/green] :{host_port}")
                 else:
-                    console.print(
+                    lines.append(
                         f"    [green]●[/green] host:{host_port} → container:{container_port}"
                     )
 
-        console.print()
+        lines.append("")
+    console.print("\n".join(lines))
@@ -14,7 +14,6 @@ import click
 from rich.table import Table
 
 from boxctl import __version__ as BOXCTL_VERSION
-from boxctl.cli import cli
 from boxctl.config import ProjectConfig
 from boxctl.container import ContainerManager
 from boxctl.paths import ContainerPaths
@@ -42,7 +41,7 @@ from boxctl.cli.helpers import (
 from boxctl.utils.project import resolve_project_dir, get_boxctl_dir
 
 
-@cli.group()
+@click.group()
 def project():
     """Manage project containers and lifecycle."""
     pass
@@ -1260,3 +1259,12 @@ def config_migrate(dry_run: bool, auto: bool):
         console.print(f"[red]Failed {len(errored)} migration(s):[/red]")
         for r in errored:
             console.print(f"  [red]✗[/red] {r.migration_id}: {r.error}")
+
+
+@click.group(name="config")
+def config_group():
+    """Configuration utilities (migrate)."""
+    pass
+
+
+config_group.add_command(config_migrate)
@@ -29,7 +29,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
-from boxctl.cli import cli
 from boxctl.container import ContainerManager
 from boxctl.paths import ContainerPaths, ContainerDefaults
 from boxctl.cli.helpers import (
@@ -1736,7 +1735,7 @@ def quick_loop():
     console.print("[dim]Goodbye![/dim]")
 
 
-@cli.command("quick")
+@click.command("quick")
 def quick():
     """Quick access menu - mobile-friendly TUI for boxctl.
 
@@ -1745,7 +1744,7 @@ def quick():
     quick_loop()
 
 
-@cli.command("q")
+@click.command("q")
 def quick_alias():
     """Quick access menu (alias for: quick)."""
     quick_loop()
@@ -20,7 +20,6 @@ from typing import Optional
 
 import click
 
-from boxctl.cli import cli
 from boxctl.container import ContainerManager
 from boxctl.cli.helpers import (
     _build_dynamic_context,
@@ -229,7 +228,7 @@ def _run_noninteractive(
     return result.returncode
 
 
-@cli.command("run")
+@click.command("run")
 @click.argument("agent", type=click.Choice(list(AGENT_CONFIGS.keys())))
 @click.argument("prompt", nargs=-1)
 @handle_errors
@@ -10,7 +10,6 @@ from pathlib import Path
 
 import click
 
-from boxctl.cli import cli
 from boxctl.cli.helpers import console, handle_errors
 from boxctl.host_config import get_config
 
@@ -64,6 +63,7 @@ Environment=XDG_RUNTIME_DIR={runtime_dir}
 Environment=DBUS_SESSION_BUS_ADDRESS={dbus_addr}
 Environment=BOXCTLD_SOCKET={socket_path}
 ExecStart={boxctl_path} service serve {socket_path}
+ExecReload=/bin/kill -HUP $MAINPID
 Restart=on-failure
 RestartSec=5
 StandardOutput=journal
@@ -93,7 +93,7 @@ web_server:
 """
 
 
-@cli.group()
+@click.group()
 def service():
     """Manage boxctld service (notifications + web UI)."""
     pass
@@ -9,7 +9,6 @@ from typing import Optional
 import click
 from rich.table import Table
 
-from boxctl.cli import cli
 from boxctl.container import get_abox_environment
 from boxctl.paths import BinPaths, ContainerPaths, ContainerDefaults
 from boxctl.utils.terminal import reset_terminal
@@ -141,7 +140,7 @@ def _run_session_agent(session_name: str, agent_type: str):
     )
 
 
-@cli.group(name="session")
+@click.group(name="session")
 def session_group():
     """Manage tmux sessions in containers.
 
@@ -212,15 +211,26 @@ def session_list(scope: Optional[str]):
                 console.print("[yellow]No boxctl containers found[/yellow]")
                 return
 
-            all_sessions = []
-            for container in all_containers:
-                cname = container.name
-                if not cname.startswith(ContainerDefaults.CONTAINER_PREFIX):
-                    continue
+            from concurrent.futures import ThreadPoolExecutor
 
-                project_name = ContainerDefaults.project_from_container(cname)
+            container_names = [
+                c.name
+                for c in all_containers
+                if c.name.startswith(ContainerDefaults.CONTAINER_PREFIX)
+            ]
 
-                sessions = _get_tmux_sessions(pctx.manager, cname)
+            # Each lookup is a docker exec; run them concurrently. Capped below
+            # docker-py's connection pool size (10) so requests don't queue on it.
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(container_names)))) as executor:
+                results = list(
+                    executor.map(
+                        lambda name: _get_tmux_sessions(pctx.manager, name), container_names
+                    )
+                )
+
+            all_sessions = []
+            for cname, sessions in zip(container_names, results):
+                project_name = ContainerDefaults.project_from_container(cname)
                 for sess in sessions:
                     all_sessions.append(
                         {
@@ -11,7 +11,6 @@ from typing import Set
 import click
 import questionary
 
-from boxctl.cli import cli
 from boxctl.cli.helpers import (
     _copy_commands,
     _remove_commands,
@@ -78,7 +77,7 @@ def _remove_skill(name: str, boxctl_dir: Path, project_dir: Path) -> bool:
     return safe_rmtree(skill_dir)
 
 
-@cli.group(invoke_without_command=True)
+@click.group(invoke_without_command=True)
 @click.pass_context
 @handle_errors
 def skill(ctx):
@@ -7,7 +7,6 @@
 import click
 from rich.table import Table
 
-from boxctl.cli import cli
 from boxctl.cli.helpers import console, handle_errors
 from boxctl.cli.helpers.daemon_client import get_usage_status_from_daemon
 
@@ -31,7 +30,7 @@ def _format_timedelta(seconds: int) -> str:
     return f"{days}d {remaining_hours}h"
 
 
-@cli.group()
+@click.group()
 def usage():
     """Agent usage tracking and fallback management.
 
@@ -10,7 +10,6 @@ from typing import Optional
 import click
 from rich.table import Table
 
-from boxctl.cli import cli
 from boxctl.cli.helpers import (
     WORKSPACES_MOUNT_ROOT,
     _get_project_context,
@@ -27,7 +26,7 @@ from boxctl.cli.helpers.completions import _complete_workspace_names
 from boxctl.utils.project import resolve_project_dir, get_boxctl_dir
 
 
-@cli.group()
+@click.group()
 def workspace():
     """Manage workspace mounts (list, add, remove)."""
     pass
@@ -10,7 +10,6 @@ from typing import Optional
 
 import click
 
-from boxctl.cli import cli
 from boxctl.container import get_abox_environment
 from boxctl.paths import ContainerPaths
 from boxctl.cli.helpers import (
@@ -212,7 +211,7 @@ def _run_worktree_shell(branch: str):
     )
 
 
-@cli.group(name="worktree")
+@click.group(name="worktree")
 def worktree_group():
     """Git worktree management.
 
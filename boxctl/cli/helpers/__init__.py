@@ -97,6 +97,7 @@ from boxctl.cli.helpers.utils import (
     _get_project_context,
     _require_container_running,
     _require_boxctl_dir,
+    _require_project_config,
     _sanitize_mount_name,
     _sync_library_mcps,
     _sync_library_skills,
@@ -116,7 +117,9 @@ from boxctl.cli.helpers.daemon_client import (
     query_daemon,
     get_sessions_from_daemon,
     get_session_counts_from_daemon,
+    send_boxctld_command,
 )
+from boxctl.utils.error_codes import ErrorCode
 
 from boxctl.cli.helpers.port_utils import (
     PortConflict,
@@ -182,6 +185,7 @@ __all__ = [
     "_get_project_context",
     "_require_container_running",
     "_require_boxctl_dir",
+    "_require_project_config",
     "_sanitize_mount_name",
     "_sync_library_mcps",
     "_sync_library_skills",
@@ -199,6 +203,8 @@ __all__ = [
     "query_daemon",
     "get_sessions_from_daemon",
     "get_session_counts_from_daemon",
+    "send_boxctld_command",
+    "ErrorCode",
     # Port utilities
     "PortConflict",
     "check_port_available",
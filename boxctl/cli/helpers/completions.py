@@ -27,19 +27,45 @@ from boxctl.paths import ContainerPaths
 # =============================================================================
 # Completion cache for fallback functions (avoids repeated Docker API calls)
 # =============================================================================
+# Every TAB press runs in a new process, so entries are also written to the
+# runtime dir; the in-memory dict only serves repeat lookups in one process.
 _completion_cache: Dict[str, List[str]] = {}
 _completion_cache_time: Dict[str, float] = {}
 _completion_cache_lock = threading.Lock()
 _COMPLETION_CACHE_TTL = 5.0  # 5 seconds - short enough to stay fresh
 
 
+def _completion_cache_file(cache_key: str) -> Path:
+    """Get the on-disk cache file for a completion cache key."""
+    from boxctl.paths import HostPaths
+
+    safe_key = "".join(c if c.isalnum() or c in "-_." else "_" for c in cache_key)
+    return HostPaths.runtime_dir() / "boxctl-completions" / f"{safe_key}.json"
+
+
 def _get_cached_completion(cache_key: str) -> Optional[List[str]]:
     """Get completion results from cache if fresh."""
+    now = time.time()
     with _completion_cache_lock:
         if cache_key in _completion_cache:
-            if time.time() - _completion_cache_time.get(cache_key, 0) < _COMPLETION_CACHE_TTL:
+            if now - _completion_cache_time.get(cache_key, 0) < _COMPLETION_CACHE_TTL:
                 return _completion_cache[cache_key]
-    return None
+
+    # Written by an earlier completion process
+    try:
+        cache_file = _completion_cache_file(cache_key)
+        mtime = cache_file.stat().st_mtime
+        if now - mtime >= _COMPLETION_CACHE_TTL:
+            return None
+        results = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(results, list):
+        return None
+    with _completion_cache_lock:
+        _completion_cache[cache_key] = results
+        _completion_cache_time[cache_key] = mtime
+    return results
 
 
 def _set_cached_completion(cache_key: str, results: List[str]) -> None:
@@ -48,6 +74,15 @@ def _set_cached_completion(cache_key: str, results: List[str]) -> None:
         _completion_cache[cache_key] = results
         _completion_cache_time[cache_key] = time.time()
 
+    try:
+        cache_file = _completion_cache_file(cache_key)
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(results))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Cache is best-effort
+
 
 def _get_boxctld_socket() -> Path:
     """Get the boxctld socket path (platform-aware: macOS vs Linux)."""
@@ -8,6 +8,7 @@ import json
 from pathlib import Path
 
 from boxctl.container import ContainerManager
+from boxctl.utils.config_io import atomic_write_bytes
 
 
 def _load_workspaces_config(boxctl_dir: Path) -> list[dict]:
@@ -84,7 +85,7 @@ def _load_mcp_meta(boxctl_dir: Path) -> dict:
     meta_path = boxctl_dir / "mcp-meta.json"
     if meta_path.exists():
         try:
-            return json.loads(meta_path.read_text())
+            return json.loads(meta_path.read_bytes())
         except Exception:
             pass
     return {"servers": {}}
@@ -93,4 +94,4 @@ def _load_mcp_meta(boxctl_dir: Path) -> dict:
 def _save_mcp_meta(boxctl_dir: Path, meta: dict) -> None:
     """Save MCP metadata to project."""
     meta_path = boxctl_dir / "mcp-meta.json"
-    meta_path.write_text(json.dumps(meta, indent=2))
+    atomic_write_bytes(meta_path, json.dumps(meta, indent=2).encode())
@@ -5,15 +5,28 @@
 """Daemon client helper for CLI tools.
 
 Provides functions to query the boxctld daemon for cached data,
-with fallback support for when the daemon is unavailable.
+with fallback support for when the daemon is unavailable, and to send
+commands over its IPC socket.
 """
 
-import json
+import atexit
+import os
+import socket
+import threading
 import urllib.request
 import urllib.error
-from typing import Optional
+from typing import Optional, Tuple
 
 from boxctl.host_config import HostConfig
+from boxctl.paths import HostPaths
+from boxctl.utils.error_codes import ErrorCode
+from boxctl.utils.json_codec import JSONDecodeError, decode_json, encode_json
+
+# IPC connection to boxctld, kept open so a process sending several commands
+# connects once. Stored with the PID that opened it so a forked child never
+# talks over its parent's connection.
+_boxctld_conn: Optional[Tuple[socket.socket, int]] = None
+_boxctld_lock = threading.Lock()
 
 
 def get_daemon_port() -> int:
@@ -42,8 +55,8 @@ def query_daemon(endpoint: str, timeout: float = 1.0) -> Optional[dict]:
     try:
         req = urllib.request.Request(url, headers={"Accept": "application/json"})
         with urllib.request.urlopen(req, timeout=timeout) as response:
-            return json.loads(response.read().decode())
-    except (urllib.error.URLError, TimeoutError, json.JSONDecodeError, Exception):
+            return decode_json(response.read())
+    except (urllib.error.URLError, TimeoutError, JSONDecodeError, Exception):
         return None
 
 
@@ -106,3 +119,101 @@ def get_usage_status_from_daemon(timeout: float = 1.0) -> Optional[dict]:
         return None
 
     return result.get("agents", {})
+
+
+def _close_boxctld_connection() -> None:
+    """Close the cached boxctld connection, if any."""
+    global _boxctld_conn
+    if _boxctld_conn is not None:
+        sock, _ = _boxctld_conn
+        _boxctld_conn = None
+        sock.close()
+
+
+atexit.register(_close_boxctld_connection)
+
+
+def _boxctld_conn_reusable(sock: socket.socket) -> bool:
+    """Check that boxctld has not closed the cached connection.
+
+    boxctld drops idle connections and may have restarted since the last
+    command. Peeks without blocking: an open connection has nothing to read.
+    """
+    sock.setblocking(False)
+    try:
+        sock.recv(1, socket.MSG_PEEK)
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.settimeout(5.0)
+    # EOF, or stray bytes that would be mistaken for the next response
+    return False
+
+
+def _boxctld_request(sock: socket.socket, payload: bytes) -> bytearray:
+    """Send one request line and read the response line (empty on EOF)."""
+    sock.sendall(payload)
+    # Grow in place and only scan new data, so large responses stay linear
+    data = bytearray()
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+        if b"\n" in chunk:
+            break
+    return data
+
+
+def send_boxctld_command(command: dict) -> dict:
+    """Send a command to boxctld over its IPC socket and return the response.
+
+    The connection stays open for later commands from this process; boxctld
+    answers any number of requests on one connection. A request is sent at
+    most once: boxctld may have acted on it even if no response comes back.
+
+    Returns:
+        Response dict, or {"ok": False, "error": ...} if the request failed.
+        The "code" is ErrorCode.NOT_RUNNING when boxctld is not running and
+        ErrorCode.NO_RESPONSE when it closed the connection without answering.
+    """
+    global _boxctld_conn
+    payload = encode_json(command) + b"\n"
+    with _boxctld_lock:
+        try:
+            if _boxctld_conn is not None:
+                sock, pid = _boxctld_conn
+                # Reconnect before sending, never by resending: after a failed
+                # request we can't tell whether boxctld already ran it
+                if pid != os.getpid() or not _boxctld_conn_reusable(sock):
+                    _close_boxctld_connection()
+
+            if _boxctld_conn is None:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                _boxctld_conn = (sock, os.getpid())
+                sock.settimeout(5.0)
+                try:
+                    sock.connect(str(HostPaths.boxctld_socket()))
+                except (FileNotFoundError, ConnectionRefusedError):
+                    # No socket, or a stale one left behind by a dead boxctld
+                    _close_boxctld_connection()
+                    return {
+                        "ok": False,
+                        "error": "boxctld not running",
+                        "code": ErrorCode.NOT_RUNNING,
+                    }
+
+            data = _boxctld_request(_boxctld_conn[0], payload)
+            if data:
+                return decode_json(data)
+            _close_boxctld_connection()
+            return {
+                "ok": False,
+                "error": "No response from boxctld",
+                "code": ErrorCode.NO_RESPONSE,
+            }
+        except Exception as e:
+            _close_boxctld_connection()
+            return {"ok": False, "error": str(e)}
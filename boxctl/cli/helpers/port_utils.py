@@ -8,7 +8,6 @@ Provides functions to check port availability before container start
 and handle conflicts with user prompts.
 """
 
-import json
 import socket
 from dataclasses import dataclass
 from pathlib import Path
@@ -16,43 +15,9 @@ from typing import Any, Dict, List, Optional
 
 from rich.console import Console
 
-console = Console()
-
-
-def _get_boxctld_socket_path() -> Path:
-    """Get the boxctld IPC socket path (platform-aware: macOS vs Linux)."""
-    from boxctl.host_config import get_config
-
-    return get_config().socket_path
-
+from boxctl.cli.helpers.daemon_client import send_boxctld_command as _send_boxctld_command
 
-def _send_boxctld_command(command: dict) -> dict:
-    """Send a command to boxctld and get response."""
-    socket_path = _get_boxctld_socket_path()
-    if not socket_path.exists():
-        return {"ok": False, "error": "boxctld not running"}
-
-    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    try:
-        sock.connect(str(socket_path))
-        sock.settimeout(5.0)
-        sock.sendall((json.dumps(command) + "\n").encode())
-
-        # Read response
-        data = b""
-        while b"\n" not in data:
-            chunk = sock.recv(4096)
-            if not chunk:
-                break
-            data += chunk
-
-        if data:
-            return json.loads(data.decode().strip())
-        return {"ok": False, "error": "No response from boxctld"}
-    except Exception as e:
-        return {"ok": False, "error": str(e)}
-    finally:
-        sock.close()
+console = Console()
 
 
 @dataclass
@@ -14,6 +14,7 @@ from rich.console import Console
 from rich.panel import Panel
 
 if TYPE_CHECKING:
+    from boxctl.config import ProjectConfig
     from boxctl.container import ContainerManager
 
 _console = Console()
@@ -134,6 +135,24 @@ def _require_boxctl_dir(boxctl_dir: Path, project_dir: Path) -> None:
         raise click.ClickException(f".boxctl/ not found in {project_dir}. Run: boxctl init")
 
 
+def _require_project_config(config: "ProjectConfig", project_dir: Path) -> None:
+    """Require .boxctl/config.yml to exist, raise ClickException if not.
+
+    Args:
+        config: ProjectConfig for the project
+        project_dir: Path to project directory (for error message)
+
+    Raises:
+        click.ClickException: If the project has no config file
+    """
+    import click
+
+    if not config.exists():
+        raise click.ClickException(
+            f"No .boxctl/config.yml found in {project_dir}. Run: boxctl init"
+        )
+
+
 def show_error_panel(title: str, message: str, hint: str = None) -> None:
     """Display a formatted error panel.
 
@@ -410,9 +410,8 @@ class ProjectConfig:
     @property
     def docker_enabled(self) -> bool:
         """Get docker socket enabled setting."""
-        if not self._model or not self._model.docker:
-            return False
-        return self._model.docker.enabled
+        docker = self._model.docker if self._model else None
+        return docker.enabled if docker is not None else False
 
     @docker_enabled.setter
     def docker_enabled(self, value: bool) -> None:
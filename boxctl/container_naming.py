@@ -14,6 +14,7 @@ All other modules should import from here instead of implementing their own logi
 import hashlib
 import os
 import re
+import string
 import subprocess
 from pathlib import Path
 from typing import Optional
@@ -27,6 +28,19 @@ logger = get_logger(__name__)
 CONTAINER_PREFIX = ContainerDefaults.CONTAINER_PREFIX
 LEGACY_CONTAINER_PREFIX = "agentbox-"  # For migration warnings
 
+# Hash suffix appended on name collisions (boxctl-myapp-a1b2)
+_HASH_SUFFIX_RE = re.compile(r".+-[a-f0-9]{4}$")
+
+
+class _SanitizeTable(dict):
+    """str.translate table: allowed chars map to themselves, everything else to '-'."""
+
+    def __missing__(self, codepoint: int) -> str:
+        return "-"
+
+
+_SANITIZE_TABLE = _SanitizeTable({ord(c): c for c in string.ascii_lowercase + string.digits + "_-"})
+
 
 def sanitize_name(name: str) -> str:
     """Sanitize a name for use in Docker container names.
@@ -38,7 +52,7 @@ def sanitize_name(name: str) -> str:
         Sanitized name safe for Docker (lowercase, alphanumeric + hyphens)
     """
     # Convert to lowercase, replace invalid chars with hyphens
-    sanitized = re.sub(r"[^a-z0-9_-]", "-", name.lower())
+    sanitized = name.lower().translate(_SANITIZE_TABLE)
     # Remove leading/trailing hyphens
     sanitized = sanitized.strip("-")
     return sanitized
@@ -218,13 +232,12 @@ def extract_project_name(container_name: str) -> Optional[str]:
     Returns:
         Project name portion, or None if not a boxctl container
     """
-    if not container_name.startswith(CONTAINER_PREFIX):
+    name = container_name.removeprefix(CONTAINER_PREFIX)
+    if len(name) == len(container_name):
         return None
 
-    name = container_name[len(CONTAINER_PREFIX) :]
-
     # Check if it has a hash suffix (4 hex chars at end after hyphen)
-    if re.match(r".+-[a-f0-9]{4}$", name):
+    if _HASH_SUFFIX_RE.match(name):
         # Remove the hash suffix
         name = name.rsplit("-", 1)[0]
 
@@ -71,13 +71,15 @@ class DockerDevicesToEnabled(Migration):
             return raw_config
 
         # Remove docker socket entries, preserving non-string entries
-        # Logic: keep entry unless it's a string containing the docker socket
-        raw_config["devices"] = [
-            d for d in devices if not (isinstance(d, str) and self.DOCKER_SOCKET in d)
-        ]
+        # Logic: keep entry unless it's a string containing the docker socket.
+        # The list is only rebuilt when it actually holds such an entry.
+        if self.detect(raw_config, project_dir):
+            raw_config["devices"] = [
+                d for d in devices if not (isinstance(d, str) and self.DOCKER_SOCKET in d)
+            ]
 
         # Remove empty devices list
-        if not raw_config["devices"]:
+        if "devices" in raw_config and not raw_config["devices"]:
             del raw_config["devices"]
 
         # Enable docker
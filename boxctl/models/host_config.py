@@ -91,12 +91,19 @@ class TailscaleMonitorConfig(BaseModel):
 
     enabled: bool = True
     check_interval_seconds: float = 30.0
+    # While the IP stays unchanged the interval doubles up to this cap
+    max_interval_seconds: float = 600.0
+    # With netlink change events (Linux), still probe at least this often
+    force_check_interval_seconds: float = 300.0
 
 
 class NetworkConfig(BaseModel):
     """Network binding configuration."""
 
     bind_addresses: List[str] = Field(default_factory=lambda: ["127.0.0.1", "tailscale"])
+    # Control socket accept strategy: "greedy" drains pending connections in
+    # batches, "single" takes one per wakeup to spread them across acceptors
+    accept_mode: str = "greedy"
 
 
 class LiteLLMProviderConfig(BaseModel):
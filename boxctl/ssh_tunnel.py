@@ -17,12 +17,13 @@ Architecture:
 Protocol:
 - All messages use envelope: {kind, type, id?, ts, payload}
 - kind: "request" (expects response), "response", "event" (fire-and-forget)
-- Framing: 4-byte big-endian length prefix + UTF-8 JSON
+- Framing: 4-byte big-endian length prefix + UTF-8 JSON (orjson when installed)
 """
 
 from __future__ import annotations
 
 import asyncio
+import inspect
 import json
 import os
 import struct
@@ -31,7 +32,7 @@ import time
 import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 try:
     import asyncssh
@@ -44,6 +45,7 @@ except ImportError:
     _SSHServerBase = object
 
 from boxctl.paths import ContainerDefaults
+from boxctl.utils.json_codec import decode_json, encode_json
 from boxctl.utils.logging import get_daemon_logger
 
 logger = get_daemon_logger("ssh-tunnel")
@@ -108,6 +110,11 @@ class ControlChannel:
         self._write_lock = asyncio.Lock()
         self._closed = False
 
+    @property
+    def closed(self) -> bool:
+        """Whether the channel has hit EOF, a write error, or been closed."""
+        return self._closed
+
     async def send(self, message: dict) -> None:
         """Send a message with length prefix."""
         if self._closed:
@@ -117,7 +124,7 @@ class ControlChannel:
         if "ts" not in message:
             message["ts"] = time.time()
 
-        data = json.dumps(message, ensure_ascii=False).encode("utf-8")
+        data = encode_json(message)
         if len(data) > MAX_MESSAGE_SIZE:
             raise ValueError(f"Message too large: {len(data)} bytes")
 
@@ -126,7 +133,10 @@ class ControlChannel:
 
         async with self._write_lock:
             try:
-                self.writer.write(header + data)
+                # Write header and body separately; concatenating would copy
+                # every frame (full pane buffers for stream_data)
+                self.writer.write(header)
+                self.writer.write(data)
                 await self.writer.drain()
             except (BrokenPipeError, ConnectionResetError, OSError) as e:
                 self._closed = True
@@ -154,7 +164,7 @@ class ControlChannel:
             data = await self.reader.readexactly(length)
 
             try:
-                return json.loads(data.decode("utf-8"))
+                return decode_json(data)
             except UnicodeDecodeError as e:
                 logger.error(
                     f"UTF-8 decode error from {self.container_name}: {e}, header={header.hex()}, data[:20]={data[:20].hex()}"
@@ -267,7 +277,7 @@ class SSHTunnelServer:
         self,
         socket_path: Path,
         allowed_hosts: Optional[Set[str]] = None,
-        get_bind_addresses: Optional[Callable[[], List[str]]] = None,
+        get_bind_addresses: Optional[Callable[[], Sequence[str]]] = None,
     ):
         if not check_asyncssh_available():
             raise ImportError("asyncssh is required for SSH tunneling")
@@ -283,10 +293,15 @@ class SSHTunnelServer:
         # Active connections: container_name -> ContainerConnection
         self.connections: Dict[str, ContainerConnection] = {}
         self.connections_lock = threading.Lock()
+        # host_port -> container for remote forwards; kept in step with each
+        # connection's remote_forwards under connections_lock
+        self._host_port_index: Dict[int, str] = {}
 
         # Message handlers: type -> async handler function
         self._request_handlers: Dict[str, Callable] = {}
         self._event_handlers: Dict[str, Callable] = {}
+        # Handlers that are coroutine functions, classified once at registration
+        self._async_handlers: Set[Callable] = set()
 
         # Server state
         self._server: Optional[asyncssh.SSHAcceptor] = None
@@ -298,10 +313,14 @@ class SSHTunnelServer:
     def register_request_handler(self, msg_type: str, handler: Callable) -> None:
         """Register a handler for request messages."""
         self._request_handlers[msg_type] = handler
+        if inspect.iscoroutinefunction(handler):
+            self._async_handlers.add(handler)
 
     def register_event_handler(self, msg_type: str, handler: Callable) -> None:
         """Register a handler for event messages."""
         self._event_handlers[msg_type] = handler
+        if inspect.iscoroutinefunction(handler):
+            self._async_handlers.add(handler)
 
     def add_allowed_port(self, port: int) -> None:
         """Add a port to the allowlist for local forwards."""
@@ -391,12 +410,9 @@ class SSHTunnelServer:
 
     async def _call_handler(self, handler: Callable, *args) -> Any:
         """Call a handler, handling both sync and async handlers."""
-        import inspect
-
-        if inspect.iscoroutinefunction(handler):
+        if handler in self._async_handlers:
             return await handler(*args)
-        else:
-            return handler(*args)
+        return handler(*args)
 
     async def _run_control_channel(
         self,
@@ -471,6 +487,12 @@ class SSHTunnelServer:
         finally:
             logger.info(f"Control channel closed for {container}")
             channel.close()
+            # Evict the dead channel so requests fail fast instead of
+            # queueing on it until the SSH connection itself is torn down
+            with self.connections_lock:
+                conn = self.connections.get(container)
+                if conn and conn.control_channel is channel:
+                    conn.control_channel = None
             process.exit(0)
 
     async def _run_loop(self) -> None:
@@ -552,10 +574,41 @@ class SSHTunnelServer:
         with self.connections_lock:
             return self.connections.get(container)
 
+    def find_remote_forward(self, host_port: int) -> Optional[str]:
+        """Get the container whose remote forward listens on host_port (thread-safe)."""
+        with self.connections_lock:
+            return self._host_port_index.get(host_port)
+
+    def untrack_remote_forward(self, container: str, host_port: int) -> bool:
+        """Stop tracking a container's remote forward (thread-safe).
+
+        Returns True if the container is connected.
+        """
+        with self.connections_lock:
+            conn = self.connections.get(container)
+            if not conn:
+                return False
+            conn.remote_forwards = [
+                f for f in conn.remote_forwards if f.get("host_port") != host_port
+            ]
+            if self._host_port_index.get(host_port) == container:
+                del self._host_port_index[host_port]
+            return True
+
+    def _unindex_remote_forwards(self, conn: ContainerConnection) -> None:
+        """Drop a connection's remote forwards from the port index.
+
+        Caller must hold connections_lock.
+        """
+        for fwd in conn.remote_forwards:
+            host_port = fwd.get("host_port")
+            if self._host_port_index.get(host_port) == conn.container:
+                del self._host_port_index[host_port]
+
     async def send_to_container(self, container: str, msg_type: str, payload: dict) -> bool:
         """Send an event to a container's control channel."""
         conn = self.get_connection(container)
-        if not conn or not conn.control_channel:
+        if not conn or not conn.control_channel or conn.control_channel.closed:
             return False
 
         try:
@@ -583,13 +636,26 @@ class SSHTunnelServer:
     ) -> Optional[dict]:
         """Send a request to a container and wait for response."""
         conn = self.get_connection(container)
-        if not conn or not conn.control_channel:
+        if not conn:
+            return None
+        return await self.request_to_connection(conn, msg_type, payload, timeout)
+
+    async def request_to_connection(
+        self, conn: ContainerConnection, msg_type: str, payload: dict, timeout: float = 30.0
+    ) -> Optional[dict]:
+        """Send a request over an already looked-up connection and wait for response.
+
+        All requests for a container are multiplexed over its single
+        persistent control channel; no per-request SSH session is opened.
+        """
+        channel = conn.control_channel
+        if not channel or channel.closed:
             return None
 
         try:
-            return await conn.control_channel.request(msg_type, payload, timeout)
+            return await channel.request(msg_type, payload, timeout)
         except Exception as e:
-            logger.error(f"Request to {container} failed: {e}")
+            logger.error(f"Request to {conn.container} failed: {e}")
             return None
 
     def request_to_container_sync(
@@ -607,6 +673,21 @@ class SSHTunnelServer:
         except Exception:
             return None
 
+    def request_to_connection_sync(
+        self, conn: ContainerConnection, msg_type: str, payload: dict, timeout: float = 30.0
+    ) -> Optional[dict]:
+        """Send a request over a known connection (sync wrapper for threaded code)."""
+        if not self._loop:
+            return None
+
+        future = asyncio.run_coroutine_threadsafe(
+            self.request_to_connection(conn, msg_type, payload, timeout), self._loop
+        )
+        try:
+            return future.result(timeout=timeout + 1.0)
+        except Exception:
+            return None
+
 
 class MultiAddressListener:
     """SSH listener that binds on multiple addresses."""
@@ -670,6 +751,7 @@ class SSHTunnelServerConnection(_SSHServerBase):
                     # Close control channel
                     if stored.control_channel:
                         stored.control_channel.close()
+                    self.server._unindex_remote_forwards(stored)
                     self.server.connections.pop(self.container_name, None)
                     should_notify = True
 
@@ -703,6 +785,7 @@ class SSHTunnelServerConnection(_SSHServerBase):
                     old_conn.control_channel.close()
                 if old_conn.connection:
                     old_connection_to_close = old_conn.connection
+                self.server._unindex_remote_forwards(old_conn)
 
             self.server.connections[username] = ContainerConnection(
                 container=username,
@@ -772,6 +855,7 @@ class SSHTunnelServerConnection(_SSHServerBase):
                         "listen_host": listen_host,
                     }
                 )
+                self.server._host_port_index[listen_port] = self.container_name
 
         return True
 
@@ -836,6 +920,8 @@ class SSHTunnelClient:
         # Message handlers
         self._request_handlers: Dict[str, Callable] = {}
         self._event_handlers: Dict[str, Callable] = {}
+        # Handlers that are coroutine functions, classified once at registration
+        self._async_handlers: Set[Callable] = set()
 
         # State
         self._running = False
@@ -852,19 +938,20 @@ class SSHTunnelClient:
     def register_request_handler(self, msg_type: str, handler: Callable) -> None:
         """Register a handler for request messages from server."""
         self._request_handlers[msg_type] = handler
+        if inspect.iscoroutinefunction(handler):
+            self._async_handlers.add(handler)
 
     def register_event_handler(self, msg_type: str, handler: Callable) -> None:
         """Register a handler for event messages from server."""
         self._event_handlers[msg_type] = handler
+        if inspect.iscoroutinefunction(handler):
+            self._async_handlers.add(handler)
 
     async def _call_handler(self, handler: Callable, *args) -> Any:
         """Call a handler, handling both sync and async handlers."""
-        import inspect
-
-        if inspect.iscoroutinefunction(handler):
+        if handler in self._async_handlers:
             return await handler(*args)
-        else:
-            return handler(*args)
+        return handler(*args)
 
     @property
     def control_channel(self) -> Optional[ControlChannel]:
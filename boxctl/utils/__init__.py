@@ -24,7 +24,13 @@ from boxctl.utils.logging import (
 from boxctl.utils.config_io import (
     load_json_config,
     save_json_config,
+    atomic_write_bytes,
 )
+from boxctl.utils.json_codec import (
+    encode_json,
+    decode_json,
+)
+from boxctl.utils.error_codes import ErrorCode
 
 __all__ = [
     # Exceptions
@@ -49,4 +55,9 @@ __all__ = [
     # Config I/O
     "load_json_config",
     "save_json_config",
+    "atomic_write_bytes",
+    # Wire JSON
+    "encode_json",
+    "decode_json",
+    "ErrorCode",
 ]
@@ -1,6 +1,7 @@
 """Configuration file I/O utilities."""
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
@@ -56,3 +57,21 @@ def save_json_config(config_path: Path, data: Any, indent: int = 2) -> None:
         logger.debug(f"Saved config to {config_path}")
     except Exception as e:
         raise ConfigSaveError(f"Failed to save {config_path}: {e}") from e
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace a file's contents so readers never see a partial write.
+
+    Writes to a temporary sibling and renames it over the target.
+
+    Args:
+        path: File to write
+        data: New file contents
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,17 @@
+"""Error codes carried in boxctld IPC responses."""
+
+from enum import IntEnum
+
+
+class ErrorCode(IntEnum):
+    """Machine-readable reason for a failed boxctld request.
+
+    Sent as the "code" field next to the human-readable "error" string, so
+    clients branch on the code and only display the text.
+    """
+
+    NOT_CONNECTED = 1  # Target container has no tunnel connection
+    NOT_RUNNING = 2  # Nothing listens on the boxctld socket
+    PORT_IN_USE = 3  # Port is already bound on the listening side
+    DOCKER_CONFLICT = 4  # Port is published by a Docker container
+    NO_RESPONSE = 5  # boxctld closed the connection without answering
@@ -0,0 +1,41 @@
+"""JSON encoding for boxctl wire protocols.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise. Both produce compact UTF-8 JSON, so peers using either backend
+interoperate.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch this for both
+JSONDecodeError = json.JSONDecodeError
+
+
+def encode_json(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_json(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Deserialize UTF-8 JSON bytes (or str).
+
+    Raises:
+        JSONDecodeError: If data is not valid JSON
+        UnicodeDecodeError: If data is not valid UTF-8 (stdlib backend only)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
@@ -159,7 +159,7 @@ print(f"BUFFER:{buffer}")
         assert "BUFFER:None" in result.stdout
 
     def test_stream_lock_exists(self, running_container, test_project):
-        """Test that stream lock is initialized."""
+        """Test that the stream buffer shard locks are initialized."""
         container_name = f"boxctl-{test_project.name}"
 
         script = """
@@ -169,8 +169,8 @@ import threading
 
 proxy = boxctld(Path("/tmp/test.sock"))
 
-# Check lock exists and is correct type
-lock_type = type(proxy.stream_lock).__name__
+# Check the container shard lock exists and is correct type
+lock_type = type(proxy._stream_lock("boxctl-test")).__name__
 expected_type = type(threading.Lock()).__name__
 print(f"LOCK_TYPE:{lock_type}")
 print(f"IS_LOCK:{lock_type == expected_type}")
@@ -946,13 +946,16 @@ print(f"IS_LIST:{isinstance(result.get(worktrees_key), list)}")
         script = """
 from boxctl.boxctld import boxctld
 from pathlib import Path
+from types import MappingProxyType
 
 proxy = boxctld(Path("/tmp/test.sock"))
 
-# Simulate container state with worktrees (isolated within this script)
-proxy.container_state["boxctl-myproject"] = {
-    "worktrees": ["feature-1", "bugfix-2"]
-}
+# Simulate container state with worktrees (isolated within this script).
+# Published the way the daemon does it: a new snapshot plus a generation bump.
+proxy.container_state = MappingProxyType({
+    "boxctl-myproject": {"worktrees": ["feature-1", "bugfix-2"]}
+})
+proxy._worktrees_gen += 1
 
 try:
     ok_key = "ok"
@@ -970,7 +973,8 @@ try:
     print(f"PROJECT_COUNT:{len(worktrees2)}")
 finally:
     # Cleanup
-    proxy.container_state.clear()
+    proxy.container_state = MappingProxyType({})
+    proxy._worktrees_gen += 1
     print(f"CLEANUP_OK:{len(proxy.container_state) == 0}")
 """
 
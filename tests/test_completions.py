@@ -0,0 +1,56 @@
+# Copyright (c) 2025 Marc Schütze <scharc@gmail.com>
+# SPDX-License-Identifier: MIT
+# See LICENSE file in the project root for full license information.
+
+"""Tests for the shell completion fallback cache."""
+
+import os
+import time
+
+import pytest
+
+from boxctl.cli.helpers import completions
+
+
+@pytest.fixture
+def cache_env(tmp_path, monkeypatch):
+    """Point the completion cache at a temporary runtime dir with an empty memory cache."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setattr(completions, "_completion_cache", {})
+    monkeypatch.setattr(completions, "_completion_cache_time", {})
+    return tmp_path
+
+
+class TestCompletionCache:
+    """Tests for the cross-process completion cache."""
+
+    def test_miss_returns_none(self, cache_env):
+        """Unknown keys are a cache miss."""
+        assert completions._get_cached_completion("projects") is None
+
+    def test_survives_new_process(self, cache_env):
+        """Entries written by one completion process are read by the next."""
+        completions._set_cached_completion("sessions:boxctl-demo", ["main", "dev"])
+        # Simulate a fresh process: drop the in-memory cache
+        completions._completion_cache.clear()
+        completions._completion_cache_time.clear()
+
+        assert completions._get_cached_completion("sessions:boxctl-demo") == ["main", "dev"]
+
+    def test_expired_file_ignored(self, cache_env):
+        """Files older than the TTL are not used."""
+        completions._set_cached_completion("projects", ["demo"])
+        completions._completion_cache.clear()
+        cache_file = completions._completion_cache_file("projects")
+        old = time.time() - completions._COMPLETION_CACHE_TTL - 1
+        os.utime(cache_file, (old, old))
+
+        assert completions._get_cached_completion("projects") is None
+
+    def test_corrupt_file_ignored(self, cache_env):
+        """Unreadable cache files are treated as a miss."""
+        cache_file = completions._completion_cache_file("projects")
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text("{not json")
+
+        assert completions._get_cached_completion("projects") is None
@@ -0,0 +1,35 @@
+# Copyright (c) 2025 Marc Schütze <scharc@gmail.com>
+# SPDX-License-Identifier: MIT
+
+"""Tests for container name sanitizing and project extraction."""
+
+import pytest
+
+from boxctl import container_naming
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        ("myapp", "myapp"),
+        ("My App", "my-app"),
+        ("my_app-2", "my_app-2"),
+        ("-leading.and.trailing-", "leading-and-trailing"),
+        ("café", "caf"),
+        ("naïve project", "na-ve-project"),
+    ],
+)
+def test_sanitize_name(raw, expected):
+    assert container_naming.sanitize_name(raw) == expected
+
+
+def test_extract_project_name_strips_prefix():
+    assert container_naming.extract_project_name("boxctl-myapp") == "myapp"
+
+
+def test_extract_project_name_strips_hash_suffix():
+    assert container_naming.extract_project_name("boxctl-myapp-a1b2") == "myapp"
+
+
+def test_extract_project_name_ignores_other_containers():
+    assert container_naming.extract_project_name("postgres") is None
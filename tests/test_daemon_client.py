@@ -0,0 +1,121 @@
+# Copyright (c) 2025 Marc Schütze <scharc@gmail.com>
+# SPDX-License-Identifier: MIT
+# See LICENSE file in the project root for full license information.
+
+"""Tests for the boxctld IPC client."""
+
+import json
+import socket
+import threading
+
+import pytest
+
+from boxctl.cli.helpers import daemon_client
+from boxctl.utils.error_codes import ErrorCode
+
+
+class FakeBoxctld:
+    """Newline-delimited JSON server that echoes the action of each request."""
+
+    def __init__(self, socket_path):
+        self.connections = 0
+        self.requests = 0
+        self.drop_after_read = False
+        self._conns = []
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(str(socket_path))
+        self._server.listen(8)
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def _accept_loop(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            self._conns.append(conn)
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        with conn, conn.makefile("rb") as reader:
+            for line in reader:
+                action = json.loads(line)["action"]
+                self.requests += 1
+                if self.drop_after_read:
+                    # Like boxctld when a handler raises: the request was read
+                    return
+                conn.sendall(json.dumps({"ok": True, "action": action}).encode() + b"\n")
+
+    def drop_connections(self):
+        """Close every accepted connection, like boxctld's idle timeout."""
+        for conn in self._conns:
+            conn.shutdown(socket.SHUT_RDWR)
+        self._conns.clear()
+
+    def close(self):
+        self._server.close()
+
+
+@pytest.fixture
+def fake_boxctld(tmp_path, monkeypatch):
+    """Run a fake boxctld on the socket path the client resolves."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    socket_dir = tmp_path / "boxctld"
+    socket_dir.mkdir()
+    server = FakeBoxctld(socket_dir / "boxctld.sock")
+    yield server
+    daemon_client._close_boxctld_connection()
+    server.close()
+
+
+class TestSendBoxctldCommand:
+    """Tests for send_boxctld_command."""
+
+    def test_not_running(self, tmp_path, monkeypatch):
+        """A missing socket is reported as an error response."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        response = daemon_client.send_boxctld_command({"action": "ping"})
+        assert response["ok"] is False
+        assert response["code"] == ErrorCode.NOT_RUNNING
+
+    def test_stale_socket_not_running(self, tmp_path, monkeypatch):
+        """A socket file nobody listens on is reported as not running."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        socket_dir = tmp_path / "boxctld"
+        socket_dir.mkdir()
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_dir / "boxctld.sock"))
+        stale.close()
+
+        response = daemon_client.send_boxctld_command({"action": "ping"})
+
+        assert response["ok"] is False
+        assert response["code"] == ErrorCode.NOT_RUNNING
+
+    def test_reuses_connection(self, fake_boxctld):
+        """Consecutive commands share one connection."""
+        for action in ("one", "two", "three"):
+            response = daemon_client.send_boxctld_command({"action": action})
+            assert response == {"ok": True, "action": action}
+        assert fake_boxctld.connections == 1
+
+    def test_reconnects_after_server_closes(self, fake_boxctld):
+        """A connection closed by boxctld is replaced transparently."""
+        daemon_client.send_boxctld_command({"action": "one"})
+        fake_boxctld.drop_connections()
+
+        response = daemon_client.send_boxctld_command({"action": "two"})
+
+        assert response == {"ok": True, "action": "two"}
+        assert fake_boxctld.connections == 2
+
+    def test_no_resend_after_request_was_read(self, fake_boxctld):
+        """A request boxctld read but did not answer is not sent again."""
+        daemon_client.send_boxctld_command({"action": "one"})
+        fake_boxctld.drop_after_read = True
+
+        response = daemon_client.send_boxctld_command({"action": "add_host_port"})
+
+        assert response["code"] == ErrorCode.NO_RESPONSE
+        assert fake_boxctld.requests == 2
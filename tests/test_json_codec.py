@@ -0,0 +1,25 @@
+# Copyright (c) 2025 Marc Schütze <scharc@gmail.com>
+# SPDX-License-Identifier: MIT
+
+"""Tests for the wire JSON codec."""
+
+import pytest
+
+from boxctl.utils import json_codec
+
+
+def test_roundtrip_preserves_unicode():
+    message = {"kind": "event", "payload": {"data": "héllo ✓", "n": [1, 2]}}
+    encoded = json_codec.encode_json(message)
+    assert isinstance(encoded, bytes)
+    assert "✓".encode("utf-8") in encoded
+    assert json_codec.decode_json(encoded) == message
+
+
+def test_decode_accepts_memoryview():
+    assert json_codec.decode_json(memoryview(b'{"ok": true}')) == {"ok": True}
+
+
+def test_decode_invalid_raises_json_error():
+    with pytest.raises(json_codec.JSONDecodeError):
+        json_codec.decode_json(b"{not json")
@@ -0,0 +1,144 @@
+# Copyright (c) 2025 Marc Schütze <scharc@gmail.com>
+# SPDX-License-Identifier: MIT
+# See LICENSE file in the project root for full license information.
+
+"""Tests for the ports command helpers."""
+
+import pytest
+from click.testing import CliRunner
+
+from boxctl.cli.commands import ports
+from boxctl.config import ProjectConfig
+from boxctl.utils.error_codes import ErrorCode
+
+
+@pytest.fixture
+def project_config(tmp_path):
+    """A project config with one exposed and one forwarded port."""
+    config_dir = tmp_path / ".boxctl"
+    config_dir.mkdir()
+    (config_dir / "config.yml").write_text(
+        'version: "1.0"\nports:\n  host: ["3000"]\n  container: ["9222"]\n'
+    )
+    return ProjectConfig(tmp_path)
+
+
+class TestParseSimpleSpec:
+    """Tests for _parse_simple_spec."""
+
+    def test_single_port(self):
+        """A bare port maps to itself."""
+        assert ports._parse_simple_spec("3000") == (3000, 3000)
+
+    def test_pair(self):
+        """Both sides of a pair are kept in order."""
+        assert ports._parse_simple_spec("8080:80") == (8080, 80)
+
+    @pytest.mark.parametrize("spec", ["1:2:3", "abc", "80:", ""])
+    def test_invalid(self, spec):
+        """Anything but one or two integers is rejected."""
+        with pytest.raises(ValueError):
+            ports._parse_simple_spec(spec)
+
+
+class TestForwardedPorts:
+    """Tests for _forwarded_ports."""
+
+    def test_string_entry(self):
+        assert ports._forwarded_ports("9222:9223") == (9222, 9223)
+
+    def test_dict_entry(self):
+        """Old dict entries default the container port to the host port."""
+        assert ports._forwarded_ports({"port": 5000}) == (5000, 5000)
+        assert ports._forwarded_ports({"port": 5000, "container_port": 5001}) == (5000, 5001)
+
+
+class TestMutatePorts:
+    """Tests for _mutate_ports."""
+
+    def test_saves_changes(self, project_config):
+        with ports._mutate_ports(project_config) as raw_ports:
+            raw_ports["host"].append("8080:80")
+
+        reloaded = ProjectConfig(project_config.project_dir)
+        assert reloaded.ports_host == ["3000", "8080:80"]
+        assert reloaded.ports_container == ["9222"]
+
+    def test_unchanged_not_saved(self, project_config):
+        """Leaving the ports as they were does not rewrite the file."""
+        before = project_config.config_path.read_text()
+
+        with ports._mutate_ports(project_config) as raw_ports:
+            raw_ports["host"] = [spec for spec in raw_ports["host"] if spec != "4000"]
+
+        assert project_config.config_path.read_text() == before
+
+
+@pytest.fixture
+def fake_daemon(project_config, monkeypatch):
+    """Run port commands against the temp project with a scripted boxctld reply."""
+    monkeypatch.setenv("BOXCTL_PROJECT_DIR", str(project_config.project_dir))
+    monkeypatch.setattr(ports, "_get_container_name", lambda: "boxctl-demo")
+    monkeypatch.setattr(
+        ports, "_get_active_ports", lambda: {"host_ports": [], "container_ports": []}
+    )
+    reply = {"ok": True}
+    monkeypatch.setattr(ports, "send_boxctld_command", lambda command: reply)
+    monkeypatch.setattr(ports, "_send_boxctld_command", lambda command: reply)
+    return reply
+
+
+@pytest.fixture
+def no_daemon(project_config, tmp_path, monkeypatch):
+    """Run port commands against the temp project with no boxctld socket."""
+    monkeypatch.setenv("BOXCTL_PROJECT_DIR", str(project_config.project_dir))
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "run"))
+    monkeypatch.setattr(ports, "_get_container_name", lambda: "boxctl-demo")
+
+
+class TestAddPortOrdering:
+    """expose/forward only persist ports the daemon could bind."""
+
+    def test_expose_saves_on_success(self, project_config, fake_daemon):
+        result = CliRunner().invoke(ports.ports, ["expose", "4000"])
+
+        assert result.exit_code == 0
+        assert ProjectConfig(project_config.project_dir).ports_host == ["3000", "4000"]
+
+    def test_expose_port_in_use_not_saved(self, project_config, fake_daemon):
+        fake_daemon.update(ok=False, error="address already in use", code=ErrorCode.PORT_IN_USE)
+
+        result = CliRunner().invoke(ports.ports, ["expose", "4000"])
+
+        assert "already in use" in result.output
+        assert ProjectConfig(project_config.project_dir).ports_host == ["3000"]
+
+    def test_forward_port_in_use_not_saved(self, project_config, fake_daemon):
+        fake_daemon.update(ok=False, error="address already in use", code=ErrorCode.PORT_IN_USE)
+
+        CliRunner().invoke(ports.ports, ["forward", "9333"])
+
+        assert ProjectConfig(project_config.project_dir).ports_container == ["9222"]
+
+    def test_expose_docker_conflict_saved(self, project_config, fake_daemon):
+        """Docker conflicts are fixed by switching to tunnel mode, which needs the saved port."""
+        fake_daemon.update(ok=False, error="bound by Docker", code=ErrorCode.DOCKER_CONFLICT)
+
+        result = CliRunner().invoke(ports.ports, ["expose", "4000"])
+
+        assert "mode: tunnel" in result.output
+        assert ProjectConfig(project_config.project_dir).ports_host == ["3000", "4000"]
+
+    def test_expose_not_running_saved(self, project_config, no_daemon):
+        """Without boxctld the port is saved and activated on the next start."""
+        result = CliRunner().invoke(ports.ports, ["expose", "4000"])
+
+        assert result.exit_code == 0
+        assert "Start proxy with" in result.output
+        assert ProjectConfig(project_config.project_dir).ports_host == ["3000", "4000"]
+
+    def test_forward_not_running_saved(self, project_config, no_daemon):
+        result = CliRunner().invoke(ports.ports, ["forward", "9333"])
+
+        assert result.exit_code == 0
+        assert ProjectConfig(project_config.project_dir).ports_container == ["9222", "9333"]